@@ -159,6 +159,12 @@ try:
     MermaidCommand()
     print("  Commands: mermaid (generate Mermaid diagrams)")
 
+    from gdbinit_ck_tile.commands import register_settings
+    register_settings()
+    print("  Settings: set ck-tile-pp children on|off")
+    print("            set ck-tile-pp verbose-errors on|off")
+    print("            set ck-tile-pp detail full|brief|off")
+
 except Exception as e:
     print(f"Failed to register pretty printers: {e}")
     import traceback
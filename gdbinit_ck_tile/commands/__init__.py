@@ -8,7 +8,8 @@ from .mermaid_generator import MermaidCommand, mermaid
 try:
     import gdb
     from .print_type_only import TypePrintCommand
-    __all__ = ['MermaidCommand', 'mermaid', 'TypePrintCommand']
+    from .settings import register_settings
+    __all__ = ['MermaidCommand', 'mermaid', 'TypePrintCommand', 'register_settings']
 except ImportError:
     # Not in GDB context
     __all__ = ['MermaidCommand', 'mermaid']
\ No newline at end of file
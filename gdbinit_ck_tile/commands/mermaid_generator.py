@@ -6,9 +6,7 @@ as a Mermaid flowchart diagram.
 """
 
 import gdb
-import re
 from ..core.transform_mixin import TransformMixin
-from ..utils.constants import TRANSFORM_PATTERNS
 from ..utils.pretty_printer_parser import PrettyPrinterOutputParser
 from ..utils.value_access import ValueAccessStrategy
 from ..utils.mermaid_builder import MermaidDiagramBuilder
@@ -58,21 +56,18 @@ class MermaidGenerator(TransformMixin):
 
         # Fallback to type string analysis
         # But be more careful - check what comes first after ck_tile::
-        import re
+        descriptor_pos = self.type_str.find('ck_tile::tensor_descriptor')
+        adaptor_pos = self.type_str.find('ck_tile::tensor_adaptor')
 
-        # Look for the first occurrence of either type after ck_tile::
-        descriptor_match = re.search(r'ck_tile::tensor_descriptor', self.type_str)
-        adaptor_match = re.search(r'ck_tile::tensor_adaptor', self.type_str)
-
-        if descriptor_match and adaptor_match:
+        if descriptor_pos != -1 and adaptor_pos != -1:
             # Both found - use the one that appears first
-            if descriptor_match.start() < adaptor_match.start():
+            if descriptor_pos < adaptor_pos:
                 return self._generate_descriptor_mermaid()
             else:
                 return self._generate_adaptor_mermaid()
-        elif descriptor_match:
+        elif descriptor_pos != -1:
             return self._generate_descriptor_mermaid()
-        elif adaptor_match:
+        elif adaptor_pos != -1:
             return self._generate_adaptor_mermaid()
         else:
             return "Error: Not a tensor_descriptor or tensor_adaptor"
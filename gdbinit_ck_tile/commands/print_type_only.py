@@ -8,6 +8,18 @@ import gdb
 import re
 
 
+class _TypeOnlyValue:
+    """Stand-in for a variable with no runtime storage; every member access fails."""
+
+    __slots__ = ('type',)
+
+    def __init__(self, type_str):
+        self.type = type_str
+
+    def __getitem__(self, key):
+        raise gdb.error("No runtime storage")
+
+
 class TypePrintCommand(gdb.Command):
     """Print a type-only variable using its type information."""
 
@@ -71,14 +83,7 @@ class TypePrintCommand(gdb.Command):
         from gdbinit_ck_tile.utils.smart_access import SmartMemberAccess
 
         # Create a mock value with this type
-        class MockValue:
-            def __init__(self, t):
-                self.type = t
-
-            def __getitem__(self, key):
-                raise gdb.error("No runtime storage")
-
-        mock = MockValue(type_str)
+        mock = _TypeOnlyValue(type_str)
 
         # Use the tensor_view printer
         printer = TensorViewPrinter(mock)
@@ -154,14 +159,7 @@ class TypePrintCommand(gdb.Command):
         from gdbinit_ck_tile.printers.tile_distribution import TileDistributionPrinter
 
         # Create mock and use printer
-        class MockValue:
-            def __init__(self, t):
-                self.type = t
-
-            def __getitem__(self, key):
-                raise gdb.error("No runtime storage")
-
-        mock = MockValue(type_str)
+        mock = _TypeOnlyValue(type_str)
         printer = TileDistributionPrinter(mock)
         result = printer.to_string()
         print(result)
@@ -171,14 +169,7 @@ class TypePrintCommand(gdb.Command):
         from gdbinit_ck_tile.printers.tile_distribution import StaticDistributedTensorPrinter
 
         # Create mock value
-        class MockValue:
-            def __init__(self, t):
-                self.type = t
-
-            def __getitem__(self, key):
-                raise gdb.error("No runtime storage")
-
-        mock = MockValue(type_str)
+        mock = _TypeOnlyValue(type_str)
 
         # Use the static distributed tensor printer
         printer = StaticDistributedTensorPrinter(mock)
@@ -0,0 +1,113 @@
+"""
+GDB parameters controlling the CK-Tile pretty printers.
+
+Usage:
+    set ck-tile-pp children on|off
+    show ck-tile-pp children
+    set ck-tile-pp verbose-errors on|off
+    show ck-tile-pp verbose-errors
+    set ck-tile-pp detail full|brief|off
+    show ck-tile-pp detail
+"""
+
+import gdb
+
+from ..utils import settings
+
+
+class CKTilePPSetPrefix(gdb.Command):
+    """Settings for the CK-Tile pretty printers."""
+
+    def __init__(self):
+        super(CKTilePPSetPrefix, self).__init__("set ck-tile-pp", gdb.COMMAND_DATA, prefix=True)
+
+
+class CKTilePPShowPrefix(gdb.Command):
+    """Show settings of the CK-Tile pretty printers."""
+
+    def __init__(self):
+        super(CKTilePPShowPrefix, self).__init__("show ck-tile-pp", gdb.COMMAND_DATA, prefix=True)
+
+
+class StructuredChildrenParameter(gdb.Parameter):
+    """Expose tile_distribution / tile_window / static_distributed_tensor /
+    tile_scatter_gather members as children.
+
+    When on, these printers keep to_string short and let the debugger expand
+    their sub-objects on demand instead of formatting them all up front."""
+
+    set_doc = "Set whether CK-Tile aggregate printers expose members as children."
+    show_doc = "Show whether CK-Tile aggregate printers expose members as children."
+
+    def __init__(self):
+        super(StructuredChildrenParameter, self).__init__(
+            "ck-tile-pp children", gdb.COMMAND_DATA, gdb.PARAM_BOOLEAN
+        )
+        self.value = settings.structured_children_enabled()
+
+    def get_set_string(self):
+        settings.set_structured_children(self.value)
+        return ""
+
+    def get_show_string(self, svalue):
+        return f"CK-Tile structured children is {svalue}."
+
+
+class VerboseErrorsParameter(gdb.Parameter):
+    """Show the message of errors hit while formatting CK-Tile values.
+
+    When off, failing members are shown as [error] without formatting the
+    (possibly very long) GDB error message. Defaults to on when the
+    CK_TILE_PP_VERBOSE environment variable is set."""
+
+    set_doc = "Set whether CK-Tile printers show error messages."
+    show_doc = "Show whether CK-Tile printers show error messages."
+
+    def __init__(self):
+        super(VerboseErrorsParameter, self).__init__(
+            "ck-tile-pp verbose-errors", gdb.COMMAND_DATA, gdb.PARAM_BOOLEAN
+        )
+        self.value = settings.verbose_errors_enabled()
+
+    def get_set_string(self):
+        settings.set_verbose_errors(self.value)
+        return ""
+
+    def get_show_string(self, svalue):
+        return f"CK-Tile verbose errors is {svalue}."
+
+
+class DetailParameter(gdb.Parameter):
+    """Set how much the CK-Tile aggregate printers show.
+
+    full:  everything (default)
+    brief: headers and encoding RsLengths/HsLengthss, no nested printers
+    off:   headers only
+
+    Lower levels keep frequent printing (bt, info locals, watches) cheap."""
+
+    set_doc = "Set the detail level of CK-Tile aggregate printers."
+    show_doc = "Show the detail level of CK-Tile aggregate printers."
+
+    def __init__(self):
+        super(DetailParameter, self).__init__(
+            "ck-tile-pp detail", gdb.COMMAND_DATA, gdb.PARAM_ENUM,
+            list(settings.DETAIL_LEVELS)
+        )
+        self.value = settings.detail_level()
+
+    def get_set_string(self):
+        settings.set_detail_level(self.value)
+        return ""
+
+    def get_show_string(self, svalue):
+        return f"CK-Tile printer detail is {svalue}."
+
+
+def register_settings():
+    """Create the `set/show ck-tile-pp` prefixes and parameters."""
+    CKTilePPSetPrefix()
+    CKTilePPShowPrefix()
+    StructuredChildrenParameter()
+    VerboseErrorsParameter()
+    DetailParameter()
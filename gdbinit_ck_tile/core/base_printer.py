@@ -5,6 +5,73 @@ Provides common utility methods shared across all printers.
 
 import re
 from ..utils.constants import MAX_SANE_VALUE
+from ..utils.settings import verbose_errors_enabled
+from ..utils.type_cache import field_names, type_string
+
+
+_CONSTANT_RE = re.compile(r'constant<(\d+)[lL]?>')
+
+
+def data_type_name(type_str):
+    """
+    Get a human-readable element data type from a type string.
+
+    Args:
+        type_str: Full type string
+
+    Returns:
+        Data type name, or None if not found
+    """
+    if '_Float16' in type_str:
+        return "float16"
+    elif 'float' in type_str:
+        return "float"
+    elif 'double' in type_str:
+        return "double"
+    elif 'int' in type_str:
+        return "int"
+    return None
+
+
+def error_marker(exc):
+    """
+    Format an exception for inline display in a printer's output.
+
+    The message is only formatted when verbose errors are enabled.
+
+    Args:
+        exc: Exception raised while formatting a member
+
+    Returns:
+        "[error: message]" with verbose errors on, otherwise "[error]"
+    """
+    if verbose_errors_enabled():
+        return f"[error: {exc}]"
+    return "[error]"
+
+
+class IndentedText(str):
+    """Sub-printer output that is already indented for its place in the parent."""
+
+
+def join_parts(parts, indent=''):
+    """
+    Join output fragments, indenting the printer's own text.
+
+    Args:
+        parts: List of string fragments; IndentedText fragments are kept as is
+        indent: Prefix to add after every newline in the other fragments
+
+    Returns:
+        Joined string
+    """
+    if not indent:
+        return "".join(parts)
+    newline = '\n' + indent
+    return "".join(
+        part if isinstance(part, IndentedText) else part.replace('\n', newline)
+        for part in parts
+    )
 
 
 class BaseCKTilePrinter:
@@ -18,6 +85,68 @@ class BaseCKTilePrinter:
             val: GDB value to print
         """
         self.val = val
+        self._type_str = None
+
+    def value_type_str(self):
+        """
+        Get str(self.val.type), computed once per printer.
+
+        to_string, children and num_children all need it, and each
+        str(gdb.Type) formats the full template name.
+
+        Returns:
+            Type string of the value
+        """
+        if self._type_str is None:
+            self._type_str = type_string(self.val.type)
+        return self._type_str
+
+    def to_string_indented(self, indent):
+        """
+        Format the value with indent added after every newline.
+
+        Printers that embed other printers override this to render their
+        children at the final indentation directly, so nested output is not
+        re-scanned once per nesting level.
+
+        Args:
+            indent: Prefix for every line after the first
+
+        Returns:
+            Formatted string
+        """
+        text = self.to_string()
+        return text.replace('\n', '\n' + indent) if indent else text
+
+    def render_child(self, printer, indent):
+        """
+        Format a sub-printer's output for embedding at the given indentation.
+
+        Args:
+            printer: Printer for the embedded value
+            indent: Prefix for every line after the first
+
+        Returns:
+            IndentedText to append to the parent's parts
+        """
+        return IndentedText(printer.to_string_indented(indent))
+
+    def has_field(self, field_name):
+        """
+        Check whether self.val may have a member, without accessing it.
+
+        Args:
+            field_name: Name of the member
+
+        Returns:
+            False only if the type is known to lack the member; True if it
+            has it or the type's fields cannot be inspected (e.g., mocks)
+        """
+        try:
+            names = field_names(self.val.type)
+        except Exception:
+            return True
+        return names is None or field_name in names
 
     def extract_int_from_field(self, obj, field_name):
         """
@@ -42,7 +171,7 @@ class BaseCKTilePrinter:
             # Check if it's a constant<> type first
             if 'constant<' in field_type_str:
                 # Extract the constant value from the type
-                const_match = re.search(r'constant<(\d+)[lL]?>', field_type_str)
+                const_match = _CONSTANT_RE.search(field_type_str)
                 if const_match:
                     val = int(const_match.group(1))
                     if abs(val) > MAX_SANE_VALUE:
@@ -115,12 +244,15 @@ class BaseCKTilePrinter:
         Format an error message for display.
 
         Args:
-            error_msg: The error message
+            error_msg: The error message, or the exception raised (whose
+                message is only shown with verbose errors on)
             context: Additional context about where the error occurred
 
         Returns:
             Formatted error string
         """
+        if isinstance(error_msg, Exception) and not verbose_errors_enabled():
+            return f"{{error: {context}}}" if context else "{error}"
         if context:
             return f"{{error: {context}: {error_msg}}}"
         return f"{{error: {error_msg}}}"
@@ -135,15 +267,7 @@ class BaseCKTilePrinter:
         Returns:
             Human-readable data type string, or None if not found
         """
-        if '_Float16' in type_str:
-            return "float16"
-        elif 'float' in type_str:
-            return "float"
-        elif 'double' in type_str:
-            return "double"
-        elif 'int' in type_str:
-            return "int"
-        return None
+        return data_type_name(type_str)
 
     def to_string(self):
         """
@@ -0,0 +1,122 @@
+"""
+Mixin class for exposing aggregate members as GDB children.
+Lets debugger front-ends expand sub-objects lazily instead of having them
+inlined into to_string.
+"""
+
+try:
+    import gdb
+except ImportError:
+    # For testing outside GDB
+    gdb = None
+
+from ..utils.settings import structured_children_enabled
+
+
+class ChildrenMixin:
+    """
+    Mixin providing children(), num_children() and children_range().
+
+    Requires:
+        - self.val: GDB value being printed
+
+    Subclasses override child_fields() to name the members to expose.
+    Children are only produced while structured children are enabled
+    (`set ck-tile-pp children on`); otherwise the printer's to_string
+    inlines the members as before.
+    """
+
+    def child_fields(self):
+        """
+        Get the names of the members to expose as children.
+
+        Returns:
+            List of field names, in display order
+        """
+        return []
+
+    def extra_children(self):
+        """
+        Get children that are not plain members (e.g., synthesized values).
+
+        Printers whose children have no gdb.Value to offer (they only
+        exist in the type) override children() instead and document that
+        they yield display-only strings.
+
+        Returns:
+            List of (name, gdb.Value) tuples appended after the members
+        """
+        return []
+
+    def structured_children(self):
+        """
+        Check whether this printer should expose its members as children.
+
+        Mock values built from type strings (type-print, scatter/gather and
+        type-only tensors) have no members to expand, so they always get the
+        full inline output.
+
+        Returns:
+            True if structured children are enabled and self.val is a real value
+        """
+        if not structured_children_enabled():
+            return False
+        value_class = getattr(gdb, 'Value', None)
+        return value_class is None or isinstance(self.val, value_class)
+
+    def _child_list(self):
+        """
+        Build (name, value) pairs for the accessible child fields once.
+
+        Returns:
+            List of (name, gdb.Value) tuples
+        """
+        cached = getattr(self, '_children_cache', None)
+        if cached is not None:
+            return cached
+
+        result = []
+        for name in self.child_fields():
+            # Skip members the type is known to lack without raising
+            if hasattr(self, 'has_field') and not self.has_field(name):
+                continue
+            try:
+                result.append((name, self.val[name]))
+            except Exception:
+                # Member not present for this instantiation
+                continue
+
+        try:
+            result.extend(self.extra_children())
+        except Exception:
+            pass
+
+        self._children_cache = result
+        return result
+
+    def children(self):
+        """Return child members for hierarchical display."""
+        if not self.structured_children():
+            return iter(())
+        return iter(self._child_list())
+
+    def num_children(self):
+        """Return the number of children without formatting any of them."""
+        if not self.structured_children():
+            return 0
+        return len(self._child_list())
+
+    def children_range(self, start, end):
+        """
+        Return the children in [start, end) for paged front-ends.
+
+        Args:
+            start: Index of the first child
+            end: Index past the last child
+
+        Returns:
+            Iterator of (name, gdb.Value) tuples
+        """
+        if not self.structured_children():
+            return iter(())
+        return iter(self._child_list()[start:end])
@@ -4,8 +4,21 @@ This eliminates the 200+ lines of duplicated transform parsing code.
 """
 
 import re
-from ..utils.constants import TRANSFORM_PATTERNS
+from ..utils.constants import TRANSFORM_NAMES, TRANSFORM_RE
 from ..utils.tuple_extractor import extract_transform_parameters
+from ..utils.cpp_type_parser import find_template_end, parse_sequence_values
+
+
+_SEQUENCE_RE = re.compile(r'sequence<([^>]*)>')
+_ADAPTOR_DIMS_RE = re.compile(
+    r'ck_tile::tensor_adaptor<[^,]+,[^,]+,[^,]+,\s*'
+    r'ck_tile::sequence<([\d,\s-]+)>,\s*'
+    r'ck_tile::sequence<([\d,\s-]+)>'
+)
+_NUMERIC_SEQUENCE_RE = re.compile(r'ck_tile::sequence<([\d,\s-]+)>')
+
+# Separator between template parameters
+_SEPARATOR_RE = re.compile(r'[, ]*')
 
 
 class TransformMixin:
@@ -45,15 +58,7 @@ class TransformMixin:
 
         # Find the matching closing bracket
         pos = template_start + len(f'{template_name}<')
-        bracket_count = 1
-        template_end = pos
-
-        while bracket_count > 0 and template_end < len(type_str):
-            if type_str[template_end] == '<':
-                bracket_count += 1
-            elif type_str[template_end] == '>':
-                bracket_count -= 1
-            template_end += 1
+        template_end = find_template_end(type_str, pos)
 
         template_content = type_str[pos:template_end-1]
 
@@ -83,58 +88,20 @@ class TransformMixin:
         Returns:
             Tuple of (transforms_str, lower_dims_str, upper_dims_str)
         """
-        transforms_str = ""
-        lower_dims_str = ""
-        upper_dims_str = ""
-
-        if not content.startswith('ck_tile::tuple<'):
-            return transforms_str, lower_dims_str, upper_dims_str
-
-        # Extract first tuple (transforms)
-        start = len('ck_tile::tuple<')
-        bracket_count = 1
-        end = start
-
-        while bracket_count > 0 and end < len(content):
-            if content[end] == '<':
-                bracket_count += 1
-            elif content[end] == '>':
-                bracket_count -= 1
-            end += 1
-
-        transforms_str = content[start:end-1]
-        remaining = content[end:].lstrip(', ')
-
-        # Extract second tuple (lower dims)
-        if remaining.startswith('ck_tile::tuple<'):
-            start = len('ck_tile::tuple<')
-            bracket_count = 1
-            end = start
-
-            while bracket_count > 0 and end < len(remaining):
-                if remaining[end] == '<':
-                    bracket_count += 1
-                elif remaining[end] == '>':
-                    bracket_count -= 1
-                end += 1
-
-            lower_dims_str = remaining[start:end-1]
-            remaining = remaining[end:].lstrip(', ')
-
-            # Extract third tuple (upper dims)
-            if remaining.startswith('ck_tile::tuple<'):
-                start = len('ck_tile::tuple<')
-                bracket_count = 1
-                end = start
-
-                while bracket_count > 0 and end < len(remaining):
-                    if remaining[end] == '<':
-                        bracket_count += 1
-                    elif remaining[end] == '>':
-                        bracket_count -= 1
-                    end += 1
-
-                upper_dims_str = remaining[start:end-1]
+        tuple_strs = []
+        pos = 0
+
+        # Walk positions in content itself: slicing off the remainder would
+        # copy the tail and rebuild its bracket map for every tuple
+        while len(tuple_strs) < 3 and content.startswith('ck_tile::tuple<', pos):
+            start = pos + len('ck_tile::tuple<')
+            end = find_template_end(content, start)
+
+            tuple_strs.append(content[start:end-1])
+            pos = _SEPARATOR_RE.match(content, end).end()
+
+        tuple_strs.extend([""] * (3 - len(tuple_strs)))
+        transforms_str, lower_dims_str, upper_dims_str = tuple_strs
 
         return transforms_str, lower_dims_str, upper_dims_str
 
@@ -149,35 +116,14 @@ class TransformMixin:
             List of transform names
         """
         transforms = []
-        pos = 0
-
-        while pos < len(transforms_str):
-            found_transform = False
-
-            for pattern, name in TRANSFORM_PATTERNS:
-                if transforms_str[pos:].startswith(pattern):
-                    transforms.append(name)
-
-                    # Skip to the end of this transform
-                    bracket_count = 1
-                    pos += len(pattern)
+        match = TRANSFORM_RE.search(transforms_str)
 
-                    while bracket_count > 0 and pos < len(transforms_str):
-                        if transforms_str[pos] == '<':
-                            bracket_count += 1
-                        elif transforms_str[pos] == '>':
-                            bracket_count -= 1
-                        pos += 1
+        while match is not None:
+            transforms.append(TRANSFORM_NAMES[match.group(1)])
 
-                    # Skip trailing comma and whitespace
-                    while pos < len(transforms_str) and transforms_str[pos] in ', \t\n':
-                        pos += 1
-
-                    found_transform = True
-                    break
-
-            if not found_transform:
-                pos += 1
+            # Skip to the end of this transform (its parameters may name others)
+            pos = find_template_end(transforms_str, match.end())
+            match = TRANSFORM_RE.search(transforms_str, pos)
 
         return transforms
 
@@ -197,18 +143,14 @@ class TransformMixin:
             return dims_list
 
         # Use regex to find all sequences, including empty ones
-        seq_matches = re.finditer(r'sequence<([^>]*)>', dims_str)
+        seq_matches = _SEQUENCE_RE.finditer(dims_str)
 
         for match in seq_matches:
             content = match.group(1).strip()
 
             if content:
                 # Parse comma-separated integers (including negative)
-                dims = [
-                    int(x.strip())
-                    for x in content.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
+                dims = parse_sequence_values(content)
                 dims_list.append(dims if dims else [])
             else:
                 # Empty sequence
@@ -228,26 +170,13 @@ class TransformMixin:
         """
         # Pattern 1: Look for tensor_adaptor in the type
         if 'tensor_adaptor' in type_str:
-            adaptor_match = re.search(
-                r'ck_tile::tensor_adaptor<[^,]+,[^,]+,[^,]+,\s*'
-                r'ck_tile::sequence<([\d,\s-]+)>,\s*'
-                r'ck_tile::sequence<([\d,\s-]+)>',
-                type_str
-            )
+            adaptor_match = _ADAPTOR_DIMS_RE.search(type_str)
             if adaptor_match:
                 bottom_str = adaptor_match.group(1)
                 top_str = adaptor_match.group(2)
 
-                bottom_dims = [
-                    int(x.strip())
-                    for x in bottom_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
-                top_dims = [
-                    int(x.strip())
-                    for x in top_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
+                bottom_dims = parse_sequence_values(bottom_str)
+                top_dims = parse_sequence_values(top_str)
 
                 return bottom_dims, top_dims
 
@@ -255,15 +184,7 @@ class TransformMixin:
         desc_start = type_str.find('tensor_descriptor<')
         if desc_start != -1:
             pos = desc_start + len('tensor_descriptor<')
-            bracket_count = 1
-            end = pos
-
-            while bracket_count > 0 and end < len(type_str):
-                if type_str[end] == '<':
-                    bracket_count += 1
-                elif type_str[end] == '>':
-                    bracket_count -= 1
-                end += 1
+            end = find_template_end(type_str, pos)
 
             desc_content = type_str[pos:end-1]
 
@@ -272,35 +193,20 @@ class TransformMixin:
             pos = 0
 
             while tuple_count < 3 and pos < len(desc_content):
-                if desc_content[pos:].startswith('ck_tile::tuple<'):
-                    start = pos + len('ck_tile::tuple<')
-                    bracket_count = 1
-                    end = start
-
-                    while bracket_count > 0 and end < len(desc_content):
-                        if desc_content[end] == '<':
-                            bracket_count += 1
-                        elif desc_content[end] == '>':
-                            bracket_count -= 1
-                        end += 1
-
-                    pos = end
-                    tuple_count += 1
-                else:
-                    pos += 1
+                tuple_start = desc_content.find('ck_tile::tuple<', pos)
+                if tuple_start == -1:
+                    pos = len(desc_content)
+                    break
+                pos = find_template_end(desc_content, tuple_start + len('ck_tile::tuple<'))
+                tuple_count += 1
 
             # After three tuples, first sequence is TopDimensionHiddenIds
             if tuple_count == 3:
-                remaining = desc_content[pos:].lstrip(', ')
-                top_match = re.search(r'ck_tile::sequence<([\d,\s-]+)>', remaining)
+                top_match = _NUMERIC_SEQUENCE_RE.search(desc_content, pos)
 
                 if top_match:
                     top_str = top_match.group(1)
-                    top_dims = [
-                        int(x.strip())
-                        for x in top_str.split(',')
-                        if x.strip().lstrip('-').isdigit()
-                    ]
+                    top_dims = parse_sequence_values(top_str)
                     # Bottom is always [0] for tensor_descriptor
                     return [0], top_dims
 
@@ -318,3 +224,46 @@ class TransformMixin:
             return extract_transform_parameters(transforms_tuple)
         except Exception:
             return []
+
+    def format_transforms(self, transforms, lower_dims_list, upper_dims_list,
+                          params_list, count=None):
+        """
+        Format the "Transforms:" section shared by descriptor and adaptor printers.
+
+        Each transform's lines are built as one fragment and the fragments
+        are joined once, rather than growing the result string line by line.
+
+        Args:
+            transforms: List of transform names
+            lower_dims_list: List of lower dimension lists, one per transform
+            upper_dims_list: List of upper dimension lists, one per transform
+            params_list: List of parameter dicts, one per transform
+            count: Number of transforms to show (defaults to all)
+
+        Returns:
+            Section text ending in a newline, or empty string if nothing to show
+        """
+        if count is None:
+            count = len(transforms)
+
+        tlines = []
+        for i in range(min(count, len(transforms))):
+            seg = [f"    [{i}] {transforms[i]}"]
+
+            # Lower dimensions
+            if i < len(lower_dims_list) and lower_dims_list[i]:
+                seg.append(f"        lower: {lower_dims_list[i]}")
+
+            # Upper dimensions
+            if i < len(upper_dims_list) and upper_dims_list[i]:
+                seg.append(f"        upper: {upper_dims_list[i]}")
+
+            # Parameters from runtime member
+            if i < len(params_list) and params_list[i]:
+                seg.extend(f"        {key}: {val}" for key, val in params_list[i].items())
+
+            tlines.append('\n'.join(seg))
+
+        if not tlines:
+            return ""
+        return "\n  Transforms:\n" + '\n'.join(tlines) + "\n"
@@ -5,6 +5,15 @@ import re
 from ..core.base_printer import BaseCKTilePrinter
 from ..utils.tuple_extractor import extract_tuple_elements
 from ..utils.constants import DEFAULT_MAX_DIMS
+from ..utils.cpp_type_parser import find_param_end
+
+
+_MULTI_INDEX_RE = re.compile(r'multi_index<(\d+)>')
+_ARRAY_LENGTH_RE = re.compile(r'\s*(\d+)[lL]?\s*>')
+_ARRAY_ELEMENT_TYPE_RE = re.compile(r'array<([^,]+),')
+_THREAD_BUF_SIZE_RE = re.compile(r'thread_buffer<[^,]+,\s*(?:\(.*?\))?(\d+)')
+_BRACKET_SIZE_RE = re.compile(r'\[(\d+)\]')
+_THREAD_BUF_TYPE_RE = re.compile(r'thread_buffer<([^,]+),')
 
 
 class TuplePrinter(BaseCKTilePrinter):
@@ -12,7 +21,7 @@ class TuplePrinter(BaseCKTilePrinter):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
 
             # Extract tuple elements using existing utility
             elements = extract_tuple_elements(self.val)
@@ -25,24 +34,23 @@ class TuplePrinter(BaseCKTilePrinter):
 
             # Build result
             plural = "element" if num_elements == 1 else "elements"
-            result = f"tuple<{num_elements} {plural}> {{\n"
+            parts = [f"tuple<{num_elements} {plural}> {{\n"]
 
             for i, elem in enumerate(elements):
-                result += f"  [{i}]: "
+                parts.append(f"  [{i}]: ")
 
                 # Try to use appropriate pretty printer for the element
                 elem_str = self._format_element(elem, i)
 
                 # Indent multi-line elements
-                elem_str_indented = elem_str.replace('\n', '\n    ')
-                result += elem_str_indented
-                result += "\n"
+                parts.append(elem_str.replace('\n', '\n    '))
+                parts.append("\n")
 
-            result += "}"
-            return result
+            parts.append("}")
+            return "".join(parts)
 
         except Exception as e:
-            return self.format_error(str(e), "tuple")
+            return self.format_error(e, "tuple")
 
     def _format_element(self, elem, index):
         """
@@ -128,12 +136,12 @@ class ArrayPrinter(BaseCKTilePrinter):
                 return f"array<{data_type}, {n}> = {elements}"
 
         except Exception as e:
-            return self.format_error(str(e), "array")
+            return self.format_error(e, "array")
 
     def _extract_array_size(self, type_str):
         """Extract N from array<T, N> or multi_index<N>"""
         # Try multi_index<N> first
-        match = re.search(r'multi_index<(\d+)>', type_str)
+        match = _MULTI_INDEX_RE.search(type_str)
         if match:
             return int(match.group(1))
 
@@ -141,30 +149,19 @@ class ArrayPrinter(BaseCKTilePrinter):
         # Element type T can have commas, so we need to find the matching comma
         array_start = type_str.find('array<')
         if array_start != -1:
-            pos = array_start + len('array<')
-            bracket_count = 1
-
             # Skip the element type (which may have nested <>)
-            while pos < len(type_str) and bracket_count > 0:
-                if type_str[pos] == '<':
-                    bracket_count += 1
-                elif type_str[pos] == '>':
-                    bracket_count -= 1
-                elif type_str[pos] == ',' and bracket_count == 1:
-                    # Found the comma separating element type from N
-                    # Extract N which comes after this comma
-                    rest = type_str[pos+1:]
-                    n_match = re.match(r'\s*(\d+)[lL]?\s*>', rest)
-                    if n_match:
-                        return int(n_match.group(1))
-                    break
-                pos += 1
+            pos = find_param_end(type_str, array_start + len('array<'))
+            if type_str[pos:pos + 1] == ',':
+                # Found the comma separating element type from N
+                n_match = _ARRAY_LENGTH_RE.match(type_str, pos + 1)
+                if n_match:
+                    return int(n_match.group(1))
 
         return None
 
     def _extract_element_type(self, type_str):
         """Extract T from array<T, N>"""
-        match = re.search(r'array<([^,]+),', type_str)
+        match = _ARRAY_ELEMENT_TYPE_RE.search(type_str)
         if match:
             elem_type = match.group(1).strip()
             # Simplify common types
@@ -220,7 +217,7 @@ class ThreadBufferPrinter(BaseCKTilePrinter):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
 
             # Very strict check - must be exactly a thread_buffer type
             if not (type_str.startswith('ck_tile::thread_buffer<') or
@@ -240,7 +237,7 @@ class ThreadBufferPrinter(BaseCKTilePrinter):
 
             # Extract size from type - handle various formats like (unsigned long)1
             # First try the improved pattern that handles type casts
-            match = re.search(r'thread_buffer<[^,]+,\s*(?:\(.*?\))?(\d+)', type_str)
+            match = _THREAD_BUF_SIZE_RE.search(type_str)
             if not match:
                 # Fallback: try to get N from static member if available
                 try:
@@ -251,7 +248,7 @@ class ThreadBufferPrinter(BaseCKTilePrinter):
                         data = self.val['data']
                         # Try to get the array size from its type
                         data_type_str = str(data.type)
-                        size_match = re.search(r'\[(\d+)\]', data_type_str)
+                        size_match = _BRACKET_SIZE_RE.search(data_type_str)
                         if size_match:
                             size = int(size_match.group(1))
                         else:
@@ -262,7 +259,7 @@ class ThreadBufferPrinter(BaseCKTilePrinter):
                 size = int(match.group(1))
 
             # Extract data type
-            data_type_match = re.search(r'thread_buffer<([^,]+),', type_str)
+            data_type_match = _THREAD_BUF_TYPE_RE.search(type_str)
             data_type = "unknown"
             if data_type_match:
                 dt = data_type_match.group(1).strip()
@@ -331,4 +328,4 @@ class ThreadBufferPrinter(BaseCKTilePrinter):
             return result
 
         except Exception as e:
-            return self.format_error(str(e), "thread_buffer")
+            return self.format_error(e, "thread_buffer")
@@ -1,7 +1,12 @@
 """Pretty printer for ck_tile::tensor_adaptor"""
 
+import re
 from ..core.base_printer import BaseCKTilePrinter
 from ..core.transform_mixin import TransformMixin
+from ..utils.cpp_type_parser import find_template_end, parse_sequence_values
+
+
+_SEQUENCE_RE = re.compile(r'ck_tile::sequence<([\d,\s-]+)>')
 
 
 class TensorAdaptorPrinter(BaseCKTilePrinter, TransformMixin):
@@ -9,7 +14,7 @@ class TensorAdaptorPrinter(BaseCKTilePrinter, TransformMixin):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
 
             # Extract transforms using mixin
             transforms, lower_dims_list, upper_dims_list = self.extract_transform_info_from_type(
@@ -23,58 +28,35 @@ class TensorAdaptorPrinter(BaseCKTilePrinter, TransformMixin):
             # Get transform parameters from runtime member
             params_list = self.get_transform_parameters_from_member()
 
-            # Build result
-            result = "tensor_adaptor{\n"
-            result += f"  ntransform: {len(transforms)}\n"
+            # Build output from parts
+            parts = ["tensor_adaptor{\n"]
+            parts.append(f"  ntransform: {len(transforms)}\n")
 
             if bottom_dims:
-                result += f"  bottom_dimension_ids: {bottom_dims}\n"
+                parts.append(f"  bottom_dimension_ids: {bottom_dims}\n")
             if top_dims:
-                result += f"  top_dimension_ids: {top_dims}\n"
+                parts.append(f"  top_dimension_ids: {top_dims}\n")
 
             # Display transforms
-            if transforms:
-                result += "\n  Transforms:\n"
-
-                for i, transform in enumerate(transforms):
-                    result += f"    [{i}] {transform}\n"
-
-                    if i < len(lower_dims_list) and lower_dims_list[i]:
-                        result += f"        lower: {lower_dims_list[i]}\n"
+            parts.append(self.format_transforms(
+                transforms, lower_dims_list, upper_dims_list, params_list
+            ))
 
-                    if i < len(upper_dims_list) and upper_dims_list[i]:
-                        result += f"        upper: {upper_dims_list[i]}\n"
-
-                    # Parameters
-                    if i < len(params_list) and params_list[i]:
-                        for key, val in params_list[i].items():
-                            result += f"        {key}: {val}\n"
-
-            result += "}"
-            return result
+            parts.append("}")
+            return "".join(parts)
 
         except Exception as e:
-            return self.format_error(str(e), "tensor_adaptor")
+            return self.format_error(e, "tensor_adaptor")
 
     def _extract_bottom_top_dims_adaptor(self, type_str):
         """Extract bottom and top dimension IDs from tensor_adaptor"""
-        import re
-
         # Find tensor_adaptor content
         adaptor_start = type_str.find('tensor_adaptor<')
         if adaptor_start == -1:
             return [], []
 
         pos = adaptor_start + len('tensor_adaptor<')
-        bracket_count = 1
-        end = pos
-
-        while bracket_count > 0 and end < len(type_str):
-            if type_str[end] == '<':
-                bracket_count += 1
-            elif type_str[end] == '>':
-                bracket_count -= 1
-            end += 1
+        end = find_template_end(type_str, pos)
 
         adaptor_content = type_str[pos:end-1]
 
@@ -83,42 +65,23 @@ class TensorAdaptorPrinter(BaseCKTilePrinter, TransformMixin):
         pos = 0
 
         while tuple_count < 3 and pos < len(adaptor_content):
-            if adaptor_content[pos:].startswith('ck_tile::tuple<'):
-                start = pos + len('ck_tile::tuple<')
-                bracket_count = 1
-                end = start
-
-                while bracket_count > 0 and end < len(adaptor_content):
-                    if adaptor_content[end] == '<':
-                        bracket_count += 1
-                    elif adaptor_content[end] == '>':
-                        bracket_count -= 1
-                    end += 1
-
-                pos = end
-                tuple_count += 1
-            else:
-                pos += 1
+            tuple_start = adaptor_content.find('ck_tile::tuple<', pos)
+            if tuple_start == -1:
+                pos = len(adaptor_content)
+                break
+            pos = find_template_end(adaptor_content, tuple_start + len('ck_tile::tuple<'))
+            tuple_count += 1
 
         # After three tuples, find the two sequences
         if tuple_count == 3:
-            remaining = adaptor_content[pos:].lstrip(', ')
-            seqs = re.findall(r'ck_tile::sequence<([\d,\s-]+)>', remaining)
+            seqs = _SEQUENCE_RE.findall(adaptor_content, pos)
 
             if len(seqs) >= 2:
                 bottom_str = seqs[0]
                 top_str = seqs[1]
 
-                bottom_dims = [
-                    int(x.strip())
-                    for x in bottom_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
-                top_dims = [
-                    int(x.strip())
-                    for x in top_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
+                bottom_dims = parse_sequence_values(bottom_str)
+                top_dims = parse_sequence_values(top_str)
 
                 return bottom_dims, top_dims
 
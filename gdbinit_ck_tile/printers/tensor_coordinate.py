@@ -1,8 +1,97 @@
 """Pretty printers for tensor coordinates"""
 
 import re
+from functools import lru_cache
 from ..core.base_printer import BaseCKTilePrinter
 from ..utils.constants import DEFAULT_MAX_DIMS
+from ..utils.cpp_type_parser import find_template_end, parse_sequence_values
+from ..utils.type_cache import register_cache
+
+
+_SEQUENCE_RE = re.compile(r'ck_tile::sequence<([^>]*)>')
+
+# Coordinate kinds and the template head that identifies each
+_COORDINATE_HEADS = (
+    ('adaptor_coord', 'tensor_adaptor_coordinate<'),
+    ('coord', 'tensor_coordinate<'),
+)
+_COORDINATE_HEAD_BY_KIND = dict(_COORDINATE_HEADS)
+
+
+@lru_cache(maxsize=256)
+def _classify_coordinate_type(type_str):
+    """
+    Classify a coordinate type string, scanning it once per unique type.
+
+    Args:
+        type_str: Full type string of the value
+
+    Returns:
+        Tuple of (kind, head_start) where kind is 'adaptor_coord', 'coord'
+        or None, and head_start is the index of the template head (or -1)
+    """
+    best_kind, best_start = None, -1
+    for kind, head in _COORDINATE_HEADS:
+        start = type_str.find(head)
+        # The outermost (earliest) head names the value's own type
+        if start != -1 and (best_start == -1 or start < best_start):
+            best_kind, best_start = kind, start
+    return best_kind, best_start
+
+
+@lru_cache(maxsize=256)
+def _parse_coordinate_type(type_str):
+    """
+    Parse NDimHidden and the hidden dimension id sequences of a coordinate.
+
+    The bracket walk runs once per unique type string; both coordinate
+    printers share the result.
+
+    Args:
+        type_str: Full type string of the value
+
+    Returns:
+        Tuple of (kind, ndim_hidden, bottom_dims, top_dims) with the dims as
+        tuples; bottom_dims is only filled for adaptor coordinates
+    """
+    kind, coord_start = _classify_coordinate_type(type_str)
+    if kind is None:
+        return None, 0, (), ()
+
+    pos = coord_start + len(_COORDINATE_HEAD_BY_KIND[kind])
+    end = find_template_end(type_str, pos)
+
+    coord_content = type_str[pos:end-1]
+
+    # Extract NDimHidden (first template parameter)
+    ndim_hidden = 0
+    first_comma = coord_content.find(',')
+    if first_comma != -1:
+        ndim_str = coord_content[:first_comma].strip()
+        if ndim_str.isdigit():
+            ndim_hidden = int(ndim_str)
+
+    # Find all sequences
+    seqs = _SEQUENCE_RE.findall(coord_content)
+
+    bottom_dims = ()
+    top_dims = ()
+
+    # Adaptor coordinates carry bottom and top ids, plain coordinates only top
+    min_seqs = 2 if kind == 'adaptor_coord' else 1
+    if len(seqs) >= min_seqs:
+        # Second-to-last sequence is BottomDimensionHiddenIds
+        if kind == 'adaptor_coord':
+            bottom_dims = tuple(parse_sequence_values(seqs[-2]))
+
+        # Last sequence is TopDimensionHiddenIds
+        top_dims = tuple(parse_sequence_values(seqs[-1]))
+
+    return kind, ndim_hidden, bottom_dims, top_dims
+
+
+register_cache(_classify_coordinate_type.cache_clear)
+register_cache(_parse_coordinate_type.cache_clear)
 
 
 class TensorAdaptorCoordinatePrinter(BaseCKTilePrinter):
@@ -10,7 +99,7 @@ class TensorAdaptorCoordinatePrinter(BaseCKTilePrinter):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
             result = "tensor_adaptor_coordinate{\n"
 
             # Extract dimension IDs and NDimHidden
@@ -44,61 +133,14 @@ class TensorAdaptorCoordinatePrinter(BaseCKTilePrinter):
             return result
 
         except Exception as e:
-            return self.format_error(str(e), "tensor_adaptor_coordinate")
+            return self.format_error(e, "tensor_adaptor_coordinate")
 
     def _extract_dimension_ids_from_type(self, type_str):
         """Extract NDimHidden, BottomDimensionHiddenIds and TopDimensionHiddenIds from type"""
-        coord_start = type_str.find('tensor_adaptor_coordinate<')
-        if coord_start == -1:
+        kind, ndim_hidden, bottom_dims, top_dims = _parse_coordinate_type(type_str)
+        if kind != 'adaptor_coord':
             return 0, [], []
-
-        pos = coord_start + len('tensor_adaptor_coordinate<')
-        bracket_count = 1
-        end = pos
-
-        while bracket_count > 0 and end < len(type_str):
-            if type_str[end] == '<':
-                bracket_count += 1
-            elif type_str[end] == '>':
-                bracket_count -= 1
-            end += 1
-
-        coord_content = type_str[pos:end-1]
-
-        # Extract NDimHidden (first template parameter)
-        ndim_hidden = 0
-        first_comma = coord_content.find(',')
-        if first_comma != -1:
-            ndim_str = coord_content[:first_comma].strip()
-            if ndim_str.isdigit():
-                ndim_hidden = int(ndim_str)
-
-        # Find all sequences
-        seqs = re.findall(r'ck_tile::sequence<([^>]*)>', coord_content)
-
-        bottom_dims = []
-        top_dims = []
-
-        if len(seqs) >= 2:
-            # Second-to-last sequence is BottomDimensionHiddenIds
-            bottom_str = seqs[-2]
-            if bottom_str.strip():
-                bottom_dims = [
-                    int(x.strip())
-                    for x in bottom_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
-
-            # Last sequence is TopDimensionHiddenIds
-            top_str = seqs[-1]
-            if top_str.strip():
-                top_dims = [
-                    int(x.strip())
-                    for x in top_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
-
-        return ndim_hidden, bottom_dims, top_dims
+        return ndim_hidden, list(bottom_dims), list(top_dims)
 
     def _extract_hidden_values(self, ndim_hidden):
         """Extract values from idx_hidden_ member"""
@@ -139,7 +181,7 @@ class TensorCoordinatePrinter(BaseCKTilePrinter):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
             result = "tensor_coordinate{\n"
 
             # Extract dimension IDs and NDimHidden
@@ -171,51 +213,14 @@ class TensorCoordinatePrinter(BaseCKTilePrinter):
             return result
 
         except Exception as e:
-            return self.format_error(str(e), "tensor_coordinate")
+            return self.format_error(e, "tensor_coordinate")
 
     def _extract_top_dimension_ids_from_type(self, type_str):
         """Extract NDimHidden and TopDimensionHiddenIds from type"""
-        coord_start = type_str.find('tensor_coordinate<')
-        if coord_start == -1:
+        kind, ndim_hidden, _, top_dims = _parse_coordinate_type(type_str)
+        if kind != 'coord':
             return 0, []
-
-        pos = coord_start + len('tensor_coordinate<')
-        bracket_count = 1
-        end = pos
-
-        while bracket_count > 0 and end < len(type_str):
-            if type_str[end] == '<':
-                bracket_count += 1
-            elif type_str[end] == '>':
-                bracket_count -= 1
-            end += 1
-
-        coord_content = type_str[pos:end-1]
-
-        # Extract NDimHidden
-        ndim_hidden = 0
-        first_comma = coord_content.find(',')
-        if first_comma != -1:
-            ndim_str = coord_content[:first_comma].strip()
-            if ndim_str.isdigit():
-                ndim_hidden = int(ndim_str)
-
-        # Find all sequences
-        seqs = re.findall(r'ck_tile::sequence<([^>]*)>', coord_content)
-
-        top_dims = []
-
-        if len(seqs) >= 1:
-            # Last sequence is TopDimensionHiddenIds
-            top_str = seqs[-1]
-            if top_str.strip():
-                top_dims = [
-                    int(x.strip())
-                    for x in top_str.split(',')
-                    if x.strip().lstrip('-').isdigit()
-                ]
-
-        return ndim_hidden, top_dims
+        return ndim_hidden, list(top_dims)
 
     def _extract_hidden_values(self, ndim_hidden):
         """Extract values from idx_hidden_ member (inherited from base)"""
@@ -1,24 +1,44 @@
 """Pretty printer for ck_tile::tensor_descriptor"""
 
 import re
-from ..core.base_printer import BaseCKTilePrinter
+from ..core.base_printer import BaseCKTilePrinter, join_parts
 from ..core.transform_mixin import TransformMixin
+from ..utils.type_cache import find_field_type
+
+
+_ELEMENT_SPACE_SIZE_RE = re.compile(r'ElementSpaceSize\s*=\s*ck_tile::constant<(\d+)[lL]?>')
+_TRAILING_CONSTANT_RE = re.compile(r'ck_tile::constant<(\d+)[lL]?>,\s*ck_tile::sequence')
 
 
 class TensorDescriptorPrinter(BaseCKTilePrinter, TransformMixin):
     """Pretty printer for ck_tile::tensor_descriptor"""
 
-    def to_string(self):
+    def to_string_indented(self, indent):
+        return self.to_string(indent=indent)
+
+    def to_string(self, inner_type_str=None, indent=''):
+        """
+        Format the descriptor.
+
+        Args:
+            inner_type_str: Descriptor type string already sliced out of an
+                enclosing type by the caller (e.g., tensor_view), so the
+                descriptor is parsed without re-stringifying its type
+            indent: Prefix for every line after the first
+
+        Returns:
+            Formatted string
+        """
         try:
-            type_str = str(self.val.type)
+            type_str = inner_type_str if inner_type_str is not None else self.value_type_str()
 
             # Extract basic fields
             elem_space_size = self.extract_int_from_field(self.val, 'element_space_size_')
             if elem_space_size is None:
                 # Try to get from type string
-                elem_match = re.search(r'ElementSpaceSize\s*=\s*ck_tile::constant<(\d+)[lL]?>', type_str)
+                elem_match = _ELEMENT_SPACE_SIZE_RE.search(type_str)
                 if not elem_match:
-                    elem_match = re.search(r'ck_tile::constant<(\d+)[lL]?>,\s*ck_tile::sequence', type_str)
+                    elem_match = _TRAILING_CONSTANT_RE.search(type_str)
                 if elem_match:
                     elem_space_size = int(elem_match.group(1))
 
@@ -30,35 +50,34 @@ class TensorDescriptorPrinter(BaseCKTilePrinter, TransformMixin):
             if self.is_uninitialized(elem_space_size, ntransform, ndim_hidden):
                 return "tensor_descriptor{[UNINITIALIZED]}"
 
-            # Build result string
-            result = "tensor_descriptor{\n"
+            # Build output from parts
+            parts = ["tensor_descriptor{\n"]
             if elem_space_size is not None:
-                result += f"  element_space_size: {elem_space_size}\n"
+                parts.append(f"  element_space_size: {elem_space_size}\n")
             if ntransform is not None:
-                result += f"  ntransform: {ntransform}\n"
+                parts.append(f"  ntransform: {ntransform}\n")
             if ndim_hidden is not None:
-                result += f"  ndim_hidden: {ndim_hidden}\n"
+                parts.append(f"  ndim_hidden: {ndim_hidden}\n")
             if ndim_top is not None:
-                result += f"  ndim_top: {ndim_top}\n"
+                parts.append(f"  ndim_top: {ndim_top}\n")
 
             # Try to get ndim_bottom from base class
             try:
-                for field in self.val.type.fields():
-                    if 'tensor_adaptor' in str(field.type):
-                        base = self.val.cast(field.type)
-                        ndim_bottom = self.extract_int_from_field(base, 'ndim_bottom_')
-                        if ndim_bottom is not None:
-                            result += f"  ndim_bottom: {ndim_bottom}\n"
-                        break
+                base_type = find_field_type(self.val.type, 'tensor_adaptor')
+                if base_type is not None:
+                    base = self.val.cast(base_type)
+                    ndim_bottom = self.extract_int_from_field(base, 'ndim_bottom_')
+                    if ndim_bottom is not None:
+                        parts.append(f"  ndim_bottom: {ndim_bottom}\n")
             except:
                 pass
 
             # Extract bottom and top dimension IDs using mixin
             bottom_dims, top_dims = self.extract_bottom_top_dims(type_str)
             if bottom_dims:
-                result += f"  bottom_dimension_ids: {bottom_dims}\n"
+                parts.append(f"  bottom_dimension_ids: {bottom_dims}\n")
             if top_dims:
-                result += f"  top_dimension_ids: {top_dims}\n"
+                parts.append(f"  top_dimension_ids: {top_dims}\n")
 
             # Extract transforms using mixin
             transforms, lower_dims_list, upper_dims_list = self.extract_transform_info_from_type(type_str)
@@ -68,26 +87,13 @@ class TensorDescriptorPrinter(BaseCKTilePrinter, TransformMixin):
 
             # Print transforms
             if transforms and ntransform and ntransform > 0:
-                result += "\n  Transforms:\n"
-
-                for i in range(min(ntransform, len(transforms))):
-                    result += f"    [{i}] {transforms[i]}\n"
-
-                    # Lower dimensions
-                    if i < len(lower_dims_list) and lower_dims_list[i]:
-                        result += f"        lower: {lower_dims_list[i]}\n"
-
-                    # Upper dimensions
-                    if i < len(upper_dims_list) and upper_dims_list[i]:
-                        result += f"        upper: {upper_dims_list[i]}\n"
-
-                    # Parameters from runtime member
-                    if i < len(params_list) and params_list[i]:
-                        for key, val in params_list[i].items():
-                            result += f"        {key}: {val}\n"
+                parts.append(self.format_transforms(
+                    transforms, lower_dims_list, upper_dims_list, params_list,
+                    count=ntransform
+                ))
 
-            result += "}"
-            return result
+            parts.append("}")
+            return join_parts(parts, indent)
 
         except Exception as e:
-            return self.format_error(str(e), "tensor_descriptor")
+            return self.format_error(e, "tensor_descriptor")
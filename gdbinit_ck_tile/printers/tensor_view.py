@@ -1,6 +1,8 @@
 """Pretty printer for ck_tile::tensor_view"""
 
-from ..core.base_printer import BaseCKTilePrinter
+from ..core.base_printer import BaseCKTilePrinter, IndentedText, error_marker, join_parts
+from ..utils.cpp_type_parser import find_matching_bracket
+from ..utils.type_cache import type_string
 from .tensor_descriptor import TensorDescriptorPrinter
 
 
@@ -8,18 +10,21 @@ class TensorViewPrinter(BaseCKTilePrinter):
     """Pretty printer for ck_tile::tensor_view"""
 
     def to_string(self):
+        return self.to_string_indented('')
+
+    def to_string_indented(self, indent):
         try:
-            type_str = str(self.val.type)
-            result = "tensor_view{\n"
+            type_str = self.value_type_str()
+            parts = ["tensor_view{\n"]
 
             # Extract data type
             data_type = self.extract_data_type(type_str)
             if data_type:
-                result += f"  data_type: {data_type}\n"
+                parts.append(f"  data_type: {data_type}\n")
 
             # Check for const
             if 'const ' in type_str:
-                result += "  const: true\n"
+                parts.append("  const: true\n")
 
             # Access descriptor
             try:
@@ -27,36 +32,61 @@ class TensorViewPrinter(BaseCKTilePrinter):
 
                 # Use tensor_descriptor printer
                 desc_printer = TensorDescriptorPrinter(desc)
-                desc_str = desc_printer.to_string()
+                desc_str = desc_printer.to_string(self._slice_descriptor_type(type_str),
+                                                  indent + '  ')
 
-                result += "\n  descriptor: "
-                result += desc_str.replace('\n', '\n  ')
-                result += "\n"
+                parts.append("\n  descriptor: ")
+                parts.append(IndentedText(desc_str))
+                parts.append("\n")
 
             except Exception as e:
-                result += f"  descriptor: [error: {str(e)}]\n"
+                parts.append(f"  descriptor: {error_marker(e)}\n")
 
             # Check for buffer_view
             try:
                 buf_view = self.val['buf_view_']
-                buf_type = str(buf_view.type)
+                buf_type = type_string(buf_view.type)
 
                 if 'buffer_view' in buf_type:
-                    result += "\n  buffer_view: {\n"
+                    parts.append("\n  buffer_view: {\n")
 
                     # Check address space
                     if 'address_space_enum)1' in buf_type:
-                        result += "    address_space: global\n"
+                        parts.append("    address_space: global\n")
                     elif 'address_space_enum)3' in buf_type:
-                        result += "    address_space: lds\n"
+                        parts.append("    address_space: lds\n")
 
-                    result += "  }\n"
+                    parts.append("  }\n")
 
             except:
                 pass
 
-            result += "}"
-            return result
+            parts.append("}")
+            return join_parts(parts, indent)
 
         except Exception as e:
-            return self.format_error(str(e), "tensor_view")
+            return self.format_error(e, "tensor_view")
+
+    def _slice_descriptor_type(self, type_str):
+        """
+        Slice the tensor_descriptor<...> type out of the view's type string.
+
+        The view's type already spells out the descriptor type, so slicing it
+        once avoids stringifying desc_'s type and rescanning the whole view.
+
+        Args:
+            type_str: Full tensor_view type string
+
+        Returns:
+            Descriptor type substring, or None to let the descriptor printer
+            read its own type
+        """
+        head = 'ck_tile::tensor_descriptor<'
+        start = type_str.find(head)
+        if start == -1:
+            return None
+
+        end = find_matching_bracket(type_str, start + len(head) - 1)
+        if end == -1:
+            return None
+        return type_str[start:end + 1]
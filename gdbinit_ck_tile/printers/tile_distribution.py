@@ -1,45 +1,438 @@
 """Pretty printers for tile distribution types"""
 
 import re
-from ..core.base_printer import BaseCKTilePrinter
+from functools import lru_cache
+
+try:
+    import gdb
+except ImportError:
+    # For testing outside GDB
+    gdb = None
+
+from ..core.base_printer import BaseCKTilePrinter, data_type_name, error_marker, join_parts
+from ..core.children_mixin import ChildrenMixin
 from .tensor_adaptor import TensorAdaptorPrinter
 from .tensor_descriptor import TensorDescriptorPrinter
+from ..utils.constants import MAX_PARSED_TYPE_LENGTH
+from ..utils.cpp_type_parser import find_matching_bracket, parse_sequence_values
+from ..utils.settings import detail_level
+from ..utils.type_cache import cached_value_output, register_cache, stripped_type_str, type_string
+
+
+# Precompiled patterns used on every to_string call
+_CONSTANT_RE = re.compile(r'constant<(\d+)>')
+_THREAD_BUF_SIZE_RE = re.compile(r'thread_buffer<[^,]+,\s*(\d+)')
+
+# Tokens of a tile_distribution_encoding parameter list: a tuple opening,
+# a whole sequence<...> (with its values), or any other bracket
+_ENCODING_TOKEN_RE = re.compile(
+    r'(?P<tuple>ck_tile::tuple<)'
+    r'|(?:ck_tile::)?sequence<(?P<seq>[^<>]*)>'
+    r'|(?P<open><)'
+    r'|(?P<close>>)'
+)
+
+
+def _tokenize_encoding(content):
+    """
+    Tokenize tile_distribution_encoding content in a single left-to-right pass.
+
+    Args:
+        content: Text between the encoding's outer angle brackets
+
+    Yields:
+        Tuples of (kind, tuple_depth, dims) where kind is 'tuple_open',
+        'tuple_close' or 'seq'. tuple_depth is the number of enclosing
+        tuples (for open/close, excluding the tuple itself) and dims is the
+        parsed sequence values for 'seq' tokens (None otherwise)
+    """
+    # One entry per open bracket: True if it opened a tuple
+    stack = []
+    tuple_depth = 0
+
+    for m in _ENCODING_TOKEN_RE.finditer(content):
+        if m.group('tuple') is not None:
+            yield 'tuple_open', tuple_depth, None
+            stack.append(True)
+            tuple_depth += 1
+        elif m.group('seq') is not None:
+            yield 'seq', tuple_depth, parse_sequence_values(m.group('seq'))
+        elif m.group('open') is not None:
+            stack.append(False)
+        elif stack and stack.pop():
+            tuple_depth -= 1
+            yield 'tuple_close', tuple_depth, None
+
+
+def _parse_encoding_content(content):
+    """
+    Split tile_distribution_encoding content into its parameter groups.
+
+    Args:
+        content: Text between the encoding's outer angle brackets
+
+    Returns:
+        Tuple of (rs_lengths, hs_lengthss, all_tuples, standalone_seqs):
+        rs_lengths is the leading sequence (or None), hs_lengthss the
+        sequences of the first tuple, all_tuples the non-empty sequences of
+        each non-empty top-level tuple, and standalone_seqs the non-empty
+        sequences outside any tuple
+    """
+    rs_lengths = None
+    top_tuples = []
+    standalone_seqs = []
+    current = None
+    first_token = True
+
+    for kind, depth, dims in _tokenize_encoding(content):
+        if kind == 'tuple_open':
+            if depth == 0:
+                current = []
+        elif kind == 'tuple_close':
+            if depth == 0:
+                top_tuples.append(current)
+                current = None
+        elif depth == 0:
+            # RsLengths is the first template parameter
+            if first_token:
+                rs_lengths = dims
+            if dims:
+                standalone_seqs.append(dims)
+        elif current is not None and dims:
+            current.append(dims)
+        first_token = False
+
+    hs_lengthss = top_tuples[0] if top_tuples else []
+    all_tuples = [seqs for seqs in top_tuples if seqs]
+    return rs_lengths, hs_lengthss, all_tuples, standalone_seqs
+
+
+def _rh_name(rh_major, rh_minor):
+    """
+    Name an RH dimension: major 0 is R, major i+1 is H[i].
+
+    Args:
+        rh_major: RH major index
+        rh_minor: RH minor index
+
+    Returns:
+        Display name such as "R[0]" or "H1[2]"
+    """
+    return f"R[{rh_minor}]" if rh_major == 0 else f"H{rh_major-1}[{rh_minor}]"
+
+
+def _encoding_for_detail(type_str):
+    """
+    Format a type's encoding at the current detail level.
+
+    Args:
+        type_str: Type string that may contain a tile_distribution_encoding<...>
+
+    Returns:
+        Formatted encoding block, or None if the type has no encoding or
+        detail is off
+    """
+    # The substring test skips hashing the whole type string for the cache
+    # when there is no encoding
+    detail = detail_level()
+    if detail == 'off' or 'tile_distribution_encoding<' not in type_str:
+        return None
+    return _format_encoding_info(type_str, detail == 'brief')
+
+
+@lru_cache(maxsize=4096)
+def _format_encoding_info(type_str, brief=False):
+    """
+    Format the tile_distribution_encoding block found in a type string.
+
+    Locating the encoding is cached per type string; formatting is cached
+    per encoding (see _format_encoding_content).
+
+    Args:
+        type_str: Type string containing a tile_distribution_encoding<...>
+        brief: Only show RsLengths and HsLengthss
+
+    Returns:
+        Formatted encoding block, or None if the type has no encoding
+    """
+    # Find the full encoding content
+    encoding_start = type_str.find('tile_distribution_encoding<')
+    if encoding_start == -1:
+        return None
+
+    # Don't tokenize pathological template spellings
+    if len(type_str) > MAX_PARSED_TYPE_LENGTH:
+        return "{ ...truncated (type too long)... }"
+
+    pos = encoding_start + len('tile_distribution_encoding<')
+    end = find_matching_bracket(type_str, pos - 1)
+    if end == -1:
+        end = len(type_str)
+
+    return _format_encoding_content(type_str[pos:end], brief)
+
+
+@lru_cache(maxsize=1024)
+def _format_encoding_content(encoding_content, brief=False):
+    """
+    Format the parameters of a tile_distribution_encoding.
+
+    Cached on the encoding text itself, so a distribution, the windows and
+    tensors built on it, and the bare encoding type all share one entry.
+
+    Args:
+        encoding_content: Text between the encoding's outer angle brackets
+        brief: Only show RsLengths and HsLengthss
+
+    Returns:
+        Formatted encoding block
+    """
+    parts = ["{\n"]
+
+    # Tokenize once and assemble every parameter group from that stream
+    rs_lengths, hs_lengthss, all_tuples, standalone_seqs = \
+        _parse_encoding_content(encoding_content)
+
+    # Parse RsLengths (first sequence not in a tuple)
+    if rs_lengths is not None:
+        parts.append(f"    RsLengths: {rs_lengths}\n")
+    else:
+        rs_lengths = []
+
+    # Parse HsLengthss (first tuple of sequences)
+    if hs_lengthss:
+        parts.append(f"    HsLengthss: [{', '.join(str(dims) for dims in hs_lengthss)}]\n")
+
+    if brief:
+        parts.append("  }")
+        return "".join(parts)
+
+    # Ps2RHssMajor and Minor (tuples 2 and 3)
+    ps_major = []
+    ps_minor = []
+    if len(all_tuples) > 1:
+        ps_major = all_tuples[1]
+    if len(all_tuples) > 2:
+        ps_minor = all_tuples[2]
+
+    # The last standalone sequences are Ys2RHs
+    ys_major = []
+    ys_minor = []
+    if len(standalone_seqs) >= 2:
+        ys_major = standalone_seqs[-2]
+        ys_minor = standalone_seqs[-1]
+
+    # (RH major, RH minor) -> name plus length, e.g. "H0[1] (length=2)";
+    # major 0 is R, major i+1 is H[i]. Unknown lengths show the name only
+    rh_described = {
+        (rh_major, rh_minor): f"{_rh_name(rh_major, rh_minor)} (length={length})"
+        for rh_major, lengths in enumerate([rs_lengths] + hs_lengthss)
+        for rh_minor, length in enumerate(lengths)
+    }
+
+    # Display raw encoding sequences first
+    if ps_major and ps_minor:
+        parts.append(f"    Ps2RHssMajor: {ps_major}\n")
+        parts.append(f"    Ps2RHssMinor: {ps_minor}\n")
+
+    if ys_major and ys_minor:
+        parts.append(f"    Ys2RHsMajor: {ys_major}\n")
+        parts.append(f"    Ys2RHsMinor: {ys_minor}\n")
+
+    # Display Ps mappings with lengths
+    if ps_major and ps_minor:
+        parts.append("    Ps mappings (with lengths):\n")
+        for p_idx, (p_major_seq, p_minor_seq) in enumerate(zip(ps_major, ps_minor)):
+            parts.append(f"      P[{p_idx}]:\n")
+            parts.extend(
+                f"        -> {rh_described.get((maj, min_)) or _rh_name(maj, min_)}\n"
+                for maj, min_ in zip(p_major_seq, p_minor_seq)
+            )
+
+    # Display Ys mappings with lengths
+    if ys_major and ys_minor:
+        parts.append("    Ys mappings (with lengths):\n")
+        parts.extend(
+            f"      Y[{y_idx}] -> {rh_described.get((maj, min_)) or _rh_name(maj, min_)}\n"
+            for y_idx, (maj, min_) in enumerate(zip(ys_major, ys_minor))
+        )
+
+    parts.append("  }")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _extract_tile_distribution_subtypes(type_str):
+    """
+    Slice the tile_distribution, tensor_adaptor and tensor_descriptor types out of a type string.
+
+    Args:
+        type_str: Type string containing a tile_distribution<...>
+
+    Returns:
+        Tuple of (dist_type, adaptor_type, desc_type); each entry is None
+        if that template is not present
+    """
+    dist_start = type_str.find('tile_distribution<')
+    if dist_start == -1:
+        return None, None, None
+
+    # Find the matching closing bracket
+    pos = dist_start + len('tile_distribution<')
+    end = find_matching_bracket(type_str, pos - 1)
+    end = len(type_str) if end == -1 else end + 1
+
+    dist_type = type_str[dist_start:end]
+    dist_content = type_str[pos:end-1]
+
+    def slice_template(name):
+        start = dist_content.find(name + '<')
+        if start == -1:
+            return None
+        close = find_matching_bracket(dist_content, start + len(name))
+        close = len(dist_content) if close == -1 else close + 1
+        return 'ck_tile::' + dist_content[start:close]
+
+    # Extract tensor_adaptor and tensor_descriptor types from within tile_distribution
+    return dist_type, slice_template('tensor_adaptor'), slice_template('tensor_descriptor')
+
+
+@lru_cache(maxsize=1024)
+def _window_summary(type_str):
+    """
+    Get the parts of a tile_window header that depend only on its type.
+
+    Args:
+        type_str: Full tile_window type string
+
+    Returns:
+        Tuple of (window_type, data_type, dims) where dims is a tuple of the
+        constant<N> values found in the type, as strings
+    """
+    # Determine window type
+    if 'tile_window_with_static_distribution' in type_str:
+        window_type = "tile_window_with_static_distribution"
+    elif 'tile_window_with_static_lengths' in type_str:
+        window_type = "tile_window_with_static_lengths"
+    else:
+        window_type = "tile_window"
+
+    dims = tuple(_CONSTANT_RE.findall(type_str)) if 'constant<' in type_str else ()
+    return window_type, data_type_name(type_str), dims
+
+
+register_cache(_format_encoding_info.cache_clear)
+register_cache(_format_encoding_content.cache_clear)
+register_cache(_extract_tile_distribution_subtypes.cache_clear)
+register_cache(_window_summary.cache_clear)
+
+
+class _TypeOnlyValue:
+    """Stand-in for a value that only has a type; every member reads as None."""
+
+    __slots__ = ('type',)
+
+    def __init__(self, type_str):
+        self.type = type_str
 
+    def __getitem__(self, key):
+        return None
 
-class TileDistributionPrinter(BaseCKTilePrinter):
+
+class _TypeOnlyDistribution(_TypeOnlyValue):
+    """Type-only tile_distribution exposing type-only ps_ys_to_xs_ / ys_to_d_ members."""
+
+    __slots__ = ('members',)
+
+    def __init__(self, dist_type, adaptor_type, desc_type):
+        super().__init__(dist_type)
+        self.members = {}
+        if adaptor_type:
+            self.members['ps_ys_to_xs_'] = _TypeOnlyValue(adaptor_type)
+        if desc_type:
+            self.members['ys_to_d_'] = _TypeOnlyValue(desc_type)
+
+    def __getitem__(self, key):
+        return self.members.get(key)
+
+
+class TileDistributionPrinter(BaseCKTilePrinter, ChildrenMixin):
     """Pretty printer for ck_tile::tile_distribution"""
 
+    def child_fields(self):
+        return ['ps_ys_to_xs_', 'ys_to_d_']
+
+    def extra_children(self):
+        """Expose the encoding as a child so it is only formatted when displayed."""
+        encoding = self._make_encoding_value()
+        return [('encoding', encoding)] if encoding is not None else []
+
+    def _make_encoding_value(self):
+        """
+        Build a value of the (empty) tile_distribution_encoding type.
+
+        The encoding only exists as the third template argument, so a
+        placeholder value of that type lets GDB apply
+        TileDistributionEncodingPrinter to it lazily.
+
+        Returns:
+            gdb.Value of the encoding type, or None if it cannot be built
+        """
+        if gdb is None:
+            return None
+        try:
+            encoding_type = self.val.type.strip_typedefs().template_argument(2)
+            if 'tile_distribution_encoding' not in str(encoding_type):
+                return None
+            return gdb.Value(bytes(max(encoding_type.sizeof, 1)), encoding_type)
+        except Exception:
+            return None
+
     def to_string(self):
+        return self.to_string_indented('')
+
+    def to_string_indented(self, indent):
+        return cached_value_output(self.val, indent, lambda: self._format(indent))
+
+    def _format(self, indent):
         try:
-            type_str = str(self.val.type)
-            result = "tile_distribution{\n"
+            # Encoding and members are shown as children on demand
+            if self.structured_children():
+                return "tile_distribution"
+
+            type_str = self.value_type_str()
+            parts = ["tile_distribution{\n"]
 
             # Extract encoding information
             encoding_info = self._extract_encoding_info(type_str)
             if encoding_info:
-                result += f"  encoding: {encoding_info}\n"
+                parts.append(f"  encoding: {encoding_info}\n")
+
+            # Nested adaptor/descriptor printers only at full detail
+            if detail_level() != 'full':
+                parts.append("}")
+                return join_parts(parts, indent)
 
             # Access ps_ys_to_xs_
             try:
                 ps_ys_to_xs = self.val['ps_ys_to_xs_']
-                ps_type = str(ps_ys_to_xs.type)
+                ps_type = type_string(ps_ys_to_xs.type)
 
-                result += "\n  ps_ys_to_xs_: "
+                parts.append("\n  ps_ys_to_xs_: ")
 
                 # Use tensor_adaptor printer if it's a tensor_adaptor
                 if 'tensor_adaptor' in ps_type:
                     adaptor_printer = TensorAdaptorPrinter(ps_ys_to_xs)
-                    adaptor_str = adaptor_printer.to_string()
-                    result += adaptor_str.replace('\n', '\n  ')
+                    parts.append(self.render_child(adaptor_printer, indent + '  '))
                 else:
-                    result += "{\n"
-                    result += f"    type: {ps_type[:50]}...\n"
-                    result += "  }"
+                    parts.append("{\n")
+                    parts.append(f"    type: {ps_type[:50]}...\n")
+                    parts.append("  }")
 
-                result += "\n"
+                parts.append("\n")
 
             except Exception as e:
-                result += f"  ps_ys_to_xs_: [error: {str(e)}]\n"
+                parts.append(f"  ps_ys_to_xs_: {error_marker(e)}\n")
 
             # Access ys_to_d_
             try:
@@ -47,216 +440,25 @@ class TileDistributionPrinter(BaseCKTilePrinter):
 
                 # Use tensor_descriptor printer
                 desc_printer = TensorDescriptorPrinter(ys_to_d)
-                desc_str = desc_printer.to_string()
+                desc_str = self.render_child(desc_printer, indent + '  ')
 
-                result += "\n  ys_to_d_: "
-                result += desc_str.replace('\n', '\n  ')
-                result += "\n"
+                parts.append("\n  ys_to_d_: ")
+                parts.append(desc_str)
+                parts.append("\n")
 
             except Exception as e:
-                result += f"  ys_to_d_: [error: {str(e)}]\n"
+                parts.append(f"  ys_to_d_: {error_marker(e)}\n")
 
-            result += "}"
-            return result
+            parts.append("}")
+            return join_parts(parts, indent)
 
         except Exception as e:
-            return self.format_error(str(e), "tile_distribution")
-
-    def _extract_encoding_info(self, type_str):
-        """Extract comprehensive tile_distribution_encoding information"""
-        if 'tile_distribution_encoding' not in type_str:
-            return None
-
-        # Find the full encoding content
-        encoding_start = type_str.find('tile_distribution_encoding<')
-        if encoding_start == -1:
-            return None
+            return self.format_error(e, "tile_distribution")
 
-        pos = encoding_start + len('tile_distribution_encoding<')
-        bracket_count = 1
-        end = pos
-        while bracket_count > 0 and end < len(type_str):
-            if type_str[end] == '<':
-                bracket_count += 1
-            elif type_str[end] == '>':
-                bracket_count -= 1
-            end += 1
-
-        encoding_content = type_str[pos:end-1]
-
-        result = "{\n"
-
-        # Parse RsLengths (first sequence not in a tuple)
-        rs_lengths = []
-        rs_match = re.search(r'^ck_tile::sequence<([\d,\s-]+)>', encoding_content)
-        if not rs_match:
-            rs_match = re.search(r',\s*ck_tile::sequence<([\d,\s-]+)>', encoding_content)
-
-        if rs_match:
-            rs_str = rs_match.group(1)
-            rs_lengths = [int(x.strip()) for x in rs_str.split(',') if x.strip().lstrip('-').isdigit()]
-            result += f"    RsLengths: {rs_lengths}\n"
-
-        # Parse HsLengthss (first tuple of sequences)
-        hs_lengthss = []
-        hs_start = encoding_content.find('ck_tile::tuple<')
-        if hs_start != -1:
-            # Extract the first tuple
-            pos = hs_start + len('ck_tile::tuple<')
-            bracket_count = 1
-            tuple_end = pos
-            while bracket_count > 0 and tuple_end < len(encoding_content):
-                if encoding_content[tuple_end] == '<':
-                    bracket_count += 1
-                elif encoding_content[tuple_end] == '>':
-                    bracket_count -= 1
-                tuple_end += 1
-
-            hs_content = encoding_content[hs_start + len('ck_tile::tuple<'):tuple_end-1]
-            hs_seqs = re.findall(r'sequence<([\d,\s-]+)>', hs_content)
-
-            if hs_seqs:
-                result += "    HsLengthss: ["
-                for i, seq in enumerate(hs_seqs):
-                    dims = [int(x.strip()) for x in seq.split(',') if x.strip().lstrip('-').isdigit()]
-                    hs_lengthss.append(dims)
-                    if i > 0:
-                        result += ", "
-                    result += str(dims)
-                result += "]\n"
-
-        # Parse all tuples to find Ps2RHss and dimension mappings
-        all_tuples = []
-        tuple_start = 0
-        while True:
-            tuple_start = encoding_content.find('ck_tile::tuple<', tuple_start)
-            if tuple_start == -1:
-                break
-
-            pos = tuple_start + len('ck_tile::tuple<')
-            bracket_count = 1
-            tuple_end = pos
-            while bracket_count > 0 and tuple_end < len(encoding_content):
-                if encoding_content[tuple_end] == '<':
-                    bracket_count += 1
-                elif encoding_content[tuple_end] == '>':
-                    bracket_count -= 1
-                tuple_end += 1
-
-            tuple_content = encoding_content[tuple_start + len('ck_tile::tuple<'):tuple_end-1]
-            seqs = re.findall(r'sequence<([\d,\s-]+)>', tuple_content)
-
-            if seqs:
-                parsed_seqs = []
-                for seq in seqs:
-                    dims = [int(x.strip()) for x in seq.split(',') if x.strip().lstrip('-').isdigit()]
-                    parsed_seqs.append(dims)
-                all_tuples.append(parsed_seqs)
-
-            tuple_start = tuple_end
-
-        # Ps2RHssMajor and Minor (tuples 2 and 3)
-        ps_major = []
-        ps_minor = []
-        if len(all_tuples) > 1:
-            ps_major = all_tuples[1]
-        if len(all_tuples) > 2:
-            ps_minor = all_tuples[2]
-
-        # Find standalone sequences at the end (Ys2RHs)
-        standalone_seqs = []
-        pos = 0
-        while pos < len(encoding_content):
-            if encoding_content[pos:].startswith('ck_tile::tuple<'):
-                # Skip the entire tuple
-                bracket_count = 1
-                pos += len('ck_tile::tuple<')
-                while bracket_count > 0 and pos < len(encoding_content):
-                    if encoding_content[pos] == '<':
-                        bracket_count += 1
-                    elif encoding_content[pos] == '>':
-                        bracket_count -= 1
-                    pos += 1
-            elif encoding_content[pos:].startswith('ck_tile::sequence<'):
-                # Found a standalone sequence
-                seq_start = pos + len('ck_tile::sequence<')
-                seq_end = encoding_content.find('>', seq_start)
-                if seq_end != -1:
-                    seq_content = encoding_content[seq_start:seq_end]
-                    dims = [int(x.strip()) for x in seq_content.split(',') if x.strip().lstrip('-').isdigit()]
-                    if dims:
-                        standalone_seqs.append(dims)
-                    pos = seq_end + 1
-                else:
-                    pos += 1
-            else:
-                pos += 1
-
-        # The last standalone sequences are Ys2RHs
-        ys_major = []
-        ys_minor = []
-        if len(standalone_seqs) >= 2:
-            ys_major = standalone_seqs[-2]
-            ys_minor = standalone_seqs[-1]
-
-        # Helper function to get length from RH major/minor
-        def get_rh_length(rh_major, rh_minor):
-            if rh_major == 0:
-                # R dimension
-                if rh_minor < len(rs_lengths):
-                    return rs_lengths[rh_minor]
-            else:
-                # H dimension (major-1 is the index into HsLengthss)
-                h_idx = rh_major - 1
-                if h_idx < len(hs_lengthss) and rh_minor < len(hs_lengthss[h_idx]):
-                    return hs_lengthss[h_idx][rh_minor]
-            return None
-
-        # Display raw encoding sequences first
-        if ps_major and ps_minor:
-            result += f"    Ps2RHssMajor: {ps_major}\n"
-            result += f"    Ps2RHssMinor: {ps_minor}\n"
-
-        if ys_major and ys_minor:
-            result += f"    Ys2RHsMajor: {ys_major}\n"
-            result += f"    Ys2RHsMinor: {ys_minor}\n"
-
-        # Display Ps mappings with lengths
-        if ps_major and ps_minor:
-            result += "    Ps mappings (with lengths):\n"
-            for p_idx in range(len(ps_major)):
-                if p_idx < len(ps_major) and p_idx < len(ps_minor):
-                    p_major_seq = ps_major[p_idx]
-                    p_minor_seq = ps_minor[p_idx]
-                    result += f"      P[{p_idx}]:\n"
-                    for i, (maj, min_) in enumerate(zip(p_major_seq, p_minor_seq)):
-                        length = get_rh_length(maj, min_)
-                        if maj == 0:
-                            result += f"        -> R[{min_}]"
-                        else:
-                            result += f"        -> H{maj-1}[{min_}]"
-                        if length is not None:
-                            result += f" (length={length})"
-                        result += "\n"
-
-        # Display Ys mappings with lengths
-        if ys_major and ys_minor:
-            result += "    Ys mappings (with lengths):\n"
-            for y_idx in range(len(ys_major)):
-                if y_idx < len(ys_major) and y_idx < len(ys_minor):
-                    maj = ys_major[y_idx]
-                    min_ = ys_minor[y_idx]
-                    length = get_rh_length(maj, min_)
-                    if maj == 0:
-                        result += f"      Y[{y_idx}] -> R[{min_}]"
-                    else:
-                        result += f"      Y[{y_idx}] -> H{maj-1}[{min_}]"
-                    if length is not None:
-                        result += f" (length={length})"
-                    result += "\n"
-
-        result += "  }"
-        return result
+    @staticmethod
+    def _extract_encoding_info(type_str):
+        """Extract tile_distribution_encoding information at the current detail level"""
+        return _encoding_for_detail(type_str)
 
 
 class TileDistributionEncodingPrinter(BaseCKTilePrinter):
@@ -264,51 +466,57 @@ class TileDistributionEncodingPrinter(BaseCKTilePrinter):
 
     def to_string(self):
         try:
-            type_str = str(self.val.type)
-            result = "tile_distribution_encoding"
+            type_str = self.value_type_str()
+            parts = ["tile_distribution_encoding"]
 
-            # Reuse the encoding extraction logic from TileDistributionPrinter
-            # Create a temporary TileDistributionPrinter instance to use its method
-            temp_printer = TileDistributionPrinter(self.val)
-            encoding_info = temp_printer._extract_encoding_info(type_str)
+            # Shared (cached) encoding formatter, no TileDistributionPrinter needed
+            encoding_info = _encoding_for_detail(type_str)
 
             if encoding_info:
-                result += encoding_info
+                parts.append(encoding_info)
             else:
-                result += "{}"
+                parts.append("{}")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            return self.format_error(str(e), "tile_distribution_encoding")
+            return self.format_error(e, "tile_distribution_encoding")
 
 
-class TileWindowPrinter(BaseCKTilePrinter):
+class TileWindowPrinter(BaseCKTilePrinter, ChildrenMixin):
     """Pretty printer for tile_window types"""
 
+    def child_fields(self):
+        return ['tile_dstr_', 'bottom_tensor_view_', 'pre_computed_coords_']
+
     def to_string(self):
+        return self.to_string_indented('')
+
+    def to_string_indented(self, indent):
+        return cached_value_output(self.val, indent, lambda: self._format(indent))
+
+    def _format(self, indent):
         try:
-            type_str = str(self.val.type)
+            type_str = self.value_type_str()
 
-            # Determine window type
-            if 'tile_window_with_static_distribution' in type_str:
-                window_type = "tile_window_with_static_distribution"
-            elif 'tile_window_with_static_lengths' in type_str:
-                window_type = "tile_window_with_static_lengths"
-            else:
-                window_type = "tile_window"
+            # Window kind, data type and dimensions (cached per type string)
+            window_type, data_type, dims_match = _window_summary(type_str)
 
-            result = f"{window_type}{{\n"
+            parts = [f"{window_type}{{\n"]
 
             # Extract data type
-            data_type = self.extract_data_type(type_str)
             if data_type:
-                result += f"  data_type: {data_type}\n"
+                parts.append(f"  data_type: {data_type}\n")
 
             # Extract window dimensions
-            dims_match = re.findall(r'constant<(\d+)>', type_str)
-            if dims_match and len(dims_match) >= 2:
-                result += f"  window_dims: [{dims_match[0]} x {dims_match[1]}]\n"
+            if len(dims_match) >= 2:
+                parts.append(f"  window_dims: [{dims_match[0]} x {dims_match[1]}]\n")
+
+            # Members are shown as children on demand, or not at all below
+            # full detail
+            if self.structured_children() or detail_level() != 'full':
+                parts.append("}")
+                return join_parts(parts, indent)
 
             # For static_distribution, access tile_dstr_
             if 'static_distribution' in window_type:
@@ -317,61 +525,68 @@ class TileWindowPrinter(BaseCKTilePrinter):
 
                     # Use tile_distribution printer
                     dstr_printer = TileDistributionPrinter(tile_dstr)
-                    dstr_str = dstr_printer.to_string()
+                    dstr_str = self.render_child(dstr_printer, indent + '  ')
 
-                    result += "\n  tile_dstr_: "
-                    result += dstr_str.replace('\n', '\n  ')
-                    result += "\n"
+                    parts.append("\n  tile_dstr_: ")
+                    parts.append(dstr_str)
+                    parts.append("\n")
 
                 except Exception as e:
-                    result += f"  tile_dstr_: [error: {str(e)}]\n"
+                    parts.append(f"  tile_dstr_: {error_marker(e)}\n")
 
-            # Access bottom_tensor_view
-            try:
-                from .tensor_view import TensorViewPrinter
-                bottom_view = self.val['bottom_tensor_view_']
+            # Access bottom_tensor_view (member test, no exception when absent)
+            if self.has_field('bottom_tensor_view_'):
+                try:
+                    from .tensor_view import TensorViewPrinter
+                    bottom_view = self.val['bottom_tensor_view_']
 
-                # Use tensor_view printer
-                view_printer = TensorViewPrinter(bottom_view)
-                view_str = view_printer.to_string()
+                    # Use tensor_view printer
+                    view_printer = TensorViewPrinter(bottom_view)
+                    view_str = self.render_child(view_printer, indent + '  ')
 
-                result += "\n  bottom_tensor_view_: "
-                result += view_str.replace('\n', '\n  ')
-                result += "\n"
+                    parts.append("\n  bottom_tensor_view_: ")
+                    parts.append(view_str)
+                    parts.append("\n")
 
-            except:
-                pass
+                except Exception:
+                    pass
 
-            # Check for pre_computed_coords
-            try:
-                coords = self.val['pre_computed_coords_']
-                result += "\n  pre_computed_coords_: present\n"
-            except:
-                pass
+            # Check for pre_computed_coords (member test, no exception when absent)
+            if self.has_field('pre_computed_coords_'):
+                try:
+                    coords = self.val['pre_computed_coords_']
+                    parts.append("\n  pre_computed_coords_: present\n")
+                except Exception:
+                    pass
 
-            result += "}"
-            return result
+            parts.append("}")
+            return join_parts(parts, indent)
 
         except Exception as e:
-            return self.format_error(str(e), window_type)
+            return self.format_error(e, window_type)
 
 
-class StaticDistributedTensorPrinter(BaseCKTilePrinter):
+class StaticDistributedTensorPrinter(BaseCKTilePrinter, ChildrenMixin):
     """Pretty printer for ck_tile::static_distributed_tensor"""
 
+    def child_fields(self):
+        return ['thread_buf_']
+
     def to_string(self):
+        return cached_value_output(self.val, '', self._format)
+
+    def _format(self):
         try:
-            # Try to get the full type by stripping typedefs
-            try:
-                type_str = str(self.val.type.strip_typedefs())
-            except:
-                type_str = str(self.val.type)
+            # Full type with typedefs stripped (memoized per stripped type name)
+            type_str = stripped_type_str(self.val.type)
 
             # Check if we have runtime data by trying to access thread_buf_
             has_runtime_data = False
             runtime_thread_buf = None
+            thread_buf = None
+            has_thread_buf = self.has_field('thread_buf_')
             try:
-                thread_buf = self.val['thread_buf_']
+                thread_buf = self.val['thread_buf_'] if has_thread_buf else None
                 # Check if it's accessible (not a type-only address)
                 if thread_buf and hasattr(thread_buf, 'address'):
                     addr_str = str(thread_buf.address) if thread_buf.address else ""
@@ -383,140 +598,75 @@ class StaticDistributedTensorPrinter(BaseCKTilePrinter):
                             test_val = data[0]
                             has_runtime_data = True
                             runtime_thread_buf = thread_buf
-                        except:
+                        except Exception:
                             pass
-            except:
+            except Exception:
                 pass
 
             # If we have runtime data, show it prominently
             if has_runtime_data and runtime_thread_buf:
-                result = "static_distributed_tensor{\n"
+                parts = ["static_distributed_tensor{\n"]
 
                 # Extract data type
                 data_type = self.extract_data_type(type_str)
                 if data_type:
-                    result += f"  data_type: {data_type}\n"
+                    parts.append(f"  data_type: {data_type}\n")
+
+                # thread_buf_ is shown as a child on demand, or not at all
+                # below full detail
+                if self.structured_children() or detail_level() != 'full':
+                    return "".join(parts) + "}"
 
                 # Show the runtime thread_buffer data
-                result += "\n  thread_buffer: "
+                parts.append("\n  thread_buffer: ")
                 from .containers import ThreadBufferPrinter
                 buf_printer = ThreadBufferPrinter(runtime_thread_buf)
-                buf_str = buf_printer.to_string()
-                result += buf_str.replace('\n', '\n  ')
-                result += "\n"
+                parts.append(self.render_child(buf_printer, '  '))
+                parts.append("\n")
 
                 # Optionally show a hint about type info
-                result += "\n  (use 'type-print' to see tile_distribution encoding details)\n"
+                parts.append("\n  (use 'type-print' to see tile_distribution encoding details)\n")
 
-                result += "}"
-                return result
+                parts.append("}")
+                return "".join(parts)
 
             # No runtime data - show type information (for type-print command)
-            result = "static_distributed_tensor{\n"
+            parts = ["static_distributed_tensor{\n"]
 
             # Extract data type
             data_type = self.extract_data_type(type_str)
             if data_type:
-                result += f"  data_type: {data_type}\n"
+                parts.append(f"  data_type: {data_type}\n")
 
-            # Try to get thread buffer size
-            try:
-                thread_buf = self.val['thread_buf_']
-                buf_type_str = str(thread_buf.type)
-                size_match = re.search(r'thread_buffer<[^,]+,\s*(\d+)', buf_type_str)
-                if size_match:
-                    buffer_size = int(size_match.group(1))
-                    result += f"  thread_buffer_size: {buffer_size}\n"
-            except:
-                pass
+            # Try to get thread buffer size, from the member read above
+            if thread_buf is not None:
+                try:
+                    buf_type_str = type_string(thread_buf.type)
+                    size_match = _THREAD_BUF_SIZE_RE.search(buf_type_str)
+                    if size_match:
+                        buffer_size = int(size_match.group(1))
+                        parts.append(f"  thread_buffer_size: {buffer_size}\n")
+                except Exception:
+                    pass
 
             # Extract and use full tile_distribution information
-            if 'tile_distribution<' in type_str:
-                # Extract the complete tile_distribution type
-                dist_start = type_str.find('tile_distribution<')
-                if dist_start != -1:
-                    # Find the matching closing bracket
-                    pos = dist_start + len('tile_distribution<')
-                    bracket_count = 1
-                    end = pos
-                    while bracket_count > 0 and end < len(type_str):
-                        if type_str[end] == '<':
-                            bracket_count += 1
-                        elif type_str[end] == '>':
-                            bracket_count -= 1
-                        end += 1
-
-                    dist_type = type_str[dist_start:end]
-                    dist_content = type_str[dist_start + len('tile_distribution<'):end-1]
-
-                    # Extract tensor_adaptor type from within tile_distribution
-                    adaptor_type = None
-                    adaptor_start = dist_content.find('tensor_adaptor<')
-                    if adaptor_start != -1:
-                        pos = adaptor_start + len('tensor_adaptor<')
-                        bracket_count = 1
-                        adaptor_end = pos
-                        while bracket_count > 0 and adaptor_end < len(dist_content):
-                            if dist_content[adaptor_end] == '<':
-                                bracket_count += 1
-                            elif dist_content[adaptor_end] == '>':
-                                bracket_count -= 1
-                            adaptor_end += 1
-                        adaptor_type = 'ck_tile::' + dist_content[adaptor_start:adaptor_end]
-
-                    # Extract tensor_descriptor type from within tile_distribution
-                    desc_type = None
-                    desc_start = dist_content.find('tensor_descriptor<')
-                    if desc_start != -1:
-                        pos = desc_start + len('tensor_descriptor<')
-                        bracket_count = 1
-                        desc_end = pos
-                        while bracket_count > 0 and desc_end < len(dist_content):
-                            if dist_content[desc_end] == '<':
-                                bracket_count += 1
-                            elif dist_content[desc_end] == '>':
-                                bracket_count -= 1
-                            desc_end += 1
-                        desc_type = 'ck_tile::' + dist_content[desc_start:desc_end]
-
-                    # Create a smart mock that returns appropriate mock members
-                    class SmartMockDistribution:
-                        def __init__(self, dist_t, adaptor_t, desc_t):
-                            self.type = dist_t
-                            self.adaptor_type = adaptor_t
-                            self.desc_type = desc_t
-
-                        def __getitem__(self, key):
-                            if key == 'ps_ys_to_xs_' and self.adaptor_type:
-                                # Return a mock tensor_adaptor
-                                class MockAdaptor:
-                                    def __init__(self, t):
-                                        self.type = t
-                                    def __getitem__(self, k):
-                                        return None
-                                return MockAdaptor(self.adaptor_type)
-                            elif key == 'ys_to_d_' and self.desc_type:
-                                # Return a mock tensor_descriptor
-                                class MockDescriptor:
-                                    def __init__(self, t):
-                                        self.type = t
-                                    def __getitem__(self, k):
-                                        return None
-                                return MockDescriptor(self.desc_type)
-                            return None
-
-                    mock_dist = SmartMockDistribution(dist_type, adaptor_type, desc_type)
+            if detail_level() == 'full' and 'tile_distribution<' in type_str:
+                # Extract the tile_distribution type and its adaptor/descriptor types
+                dist_type, adaptor_type, desc_type = _extract_tile_distribution_subtypes(type_str)
+                if dist_type is not None:
+                    # Type-only stand-in whose members carry the adaptor/descriptor types
+                    mock_dist = _TypeOnlyDistribution(dist_type, adaptor_type, desc_type)
                     dist_printer = TileDistributionPrinter(mock_dist)
-                    dist_str = dist_printer.to_string()
+                    dist_str = self.render_child(dist_printer, '  ')
 
                     # Add the tile_distribution output indented
-                    result += "\n  tile_distribution: "
-                    result += dist_str.replace('\n', '\n  ')
-                    result += "\n"
+                    parts.append("\n  tile_distribution: ")
+                    parts.append(dist_str)
+                    parts.append("\n")
 
-            result += "}"
-            return result
+            parts.append("}")
+            return "".join(parts)
 
         except Exception as e:
-            return self.format_error(str(e), "static_distributed_tensor")
+            return self.format_error(e, "static_distributed_tensor")
 
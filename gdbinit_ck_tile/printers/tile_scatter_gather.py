@@ -7,349 +7,444 @@ Handles:
 
 import gdb
 import re
+from functools import lru_cache
 from ..core.base_printer import BaseCKTilePrinter
+from ..core.children_mixin import ChildrenMixin
+from ..utils.cpp_type_parser import count_transforms, find_template_end
+from ..utils.settings import detail_level, verbose_errors_enabled
+from ..utils.type_cache import register_cache
 
 
-class TileScatterGatherPrinter(BaseCKTilePrinter):
+_CONSTANT_RE = re.compile(r'constant<(\d+)>')
+_MEMORY_OPERATION_RE = re.compile(r'\(ck_tile::memory_operation_enum\)(\d+)')
+
+# (type string, detail level, verbose errors) -> rendered output. Everything
+# shown is recovered from the type, so the output depends on nothing else.
+_RENDER_CACHE = {}
+_MAX_RENDER_CACHE_ENTRIES = 512
+register_cache(_RENDER_CACHE.clear)
+
+
+# Templates the mocks below slice out of a scatter/gather type
+_MOCK_TEMPLATE_RE = re.compile(r'(tile_distribution|tensor_adaptor|tensor_descriptor|buffer_view)<')
+
+
+def _scan_templates(type_str):
+    """
+    Find where each template used by the mocks starts, in one pass.
+
+    Args:
+        type_str: Type string to scan
+
+    Returns:
+        Dict of template name -> list of start positions, in order
+    """
+    starts = {}
+    for match in _MOCK_TEMPLATE_RE.finditer(type_str):
+        starts.setdefault(match.group(1), []).append(match.start())
+    return starts
+
+
+def _slice_template(type_str, starts, name, index=0, lo=0, hi=None):
+    """
+    Slice a name<...> template out of a type string.
+
+    Args:
+        type_str: Type string the starts were scanned from
+        starts: Result of _scan_templates(type_str)
+        name: Template name (e.g., 'tensor_adaptor')
+        index: Which of the templates starting in [lo, hi) to take (-1 for the last)
+        lo: Start of the region to take the template from
+        hi: End of the region (default: end of string); the template is cut off there
+
+    Returns:
+        The name<...> substring, or None if no template starts in the region
+    """
+    if hi is None:
+        hi = len(type_str)
+    inside = [pos for pos in starts.get(name, ()) if lo <= pos < hi]
+    if not inside:
+        return None
+    start = inside[index]
+    end = min(find_template_end(type_str, start + len(name) + 1), hi)
+    return type_str[start:end]
+
+
+class _MockType:
+    """Type stand-in whose str() is a type string; type aliases have no runtime fields."""
+
+    __slots__ = ('_type_str',)
+
+    def __init__(self, type_str):
+        self._type_str = type_str
+
+    def __str__(self):
+        return self._type_str
+
+    def fields(self):
+        return []
+
+
+class _MockTypeOnlyMember:
+    """
+    Stand-in for a member that only exists as a type (tensor_adaptor, tensor_descriptor).
+
+    Every field access fails so extract_int_from_field gracefully falls back
+    to type string extraction.
+    """
+
+    __slots__ = ('type',)
+
+    def __init__(self, type_str):
+        self.type = _MockType(type_str)
+
+    def __getitem__(self, field_name):
+        raise gdb.error(f"No member named {field_name}")
+
+    def cast(self, target_type):
+        return self
+
+
+class _MockDistribution:
+    """tile_distribution stand-in serving ps_ys_to_xs_ and ys_to_d_ from the type string."""
+
+    __slots__ = ('type', 'members')
+
+    def __init__(self, type_str):
+        self.type = type_str
+
+        # Locate every template of interest in one pass
+        starts = _scan_templates(type_str)
+
+        # Extract the tile_distribution<...> portion
+        dist_type_str = _slice_template(type_str, starts, 'tile_distribution') or type_str
+        dist_start = starts['tile_distribution'][0] if 'tile_distribution' in starts else 0
+        dist_end = dist_start + len(dist_type_str)
+
+        # Extract tensor_adaptor portion
+        adaptor_type_str = _slice_template(type_str, starts, 'tensor_adaptor',
+                                           0, dist_start, dist_end)
+
+        # In tile_distribution, the tensor_descriptor of ys_to_d_ comes after
+        # tensor_adaptor, so take the last one
+        desc_type_str = _slice_template(type_str, starts, 'tensor_descriptor',
+                                        -1, dist_start, dist_end)
+
+        # Built once, however often the printer reads them. Fall back to the
+        # full distribution type if a portion is missing.
+        self.members = {
+            'ps_ys_to_xs_': _MockTypeOnlyMember(adaptor_type_str or dist_type_str),
+            'ys_to_d_': _MockTypeOnlyMember(desc_type_str or dist_type_str),
+        }
+
+    def __getitem__(self, key):
+        try:
+            return self.members[key]
+        except KeyError:
+            raise gdb.error(f"No member named {key}")
+
+
+class _MockConstantField:
+    """Field stand-in typed ck_tile::constant<N>."""
+
+    __slots__ = ('type', '_val')
+
+    def __init__(self, val=1):
+        self.type = f'ck_tile::constant<{val}>'
+        self._val = val
+
+    def __int__(self):
+        return self._val
+
+
+@lru_cache(maxsize=64)
+def _constant_field(val=1):
+    """
+    Get the shared _MockConstantField for a value.
+
+    The fields are never modified, so every descriptor mock can reuse one
+    instance per value instead of allocating its own.
+
+    Args:
+        val: Value of the constant
+
+    Returns:
+        _MockConstantField typed ck_tile::constant<val>
+    """
+    return _MockConstantField(val)
+
+
+class _MockViewDescriptor:
+    """tensor_descriptor stand-in providing the fields TensorDescriptorPrinter needs."""
+
+    __slots__ = ('type', 'members')
+
+    def __init__(self, type_str):
+        self.type = type_str
+        # Count transforms of every kind in one pass over the type
+        transform_count = sum(count_transforms(type_str).values())
+
+        # Any non-None value prevents UNINITIALIZED
+        placeholder = _constant_field()
+        self.members = {
+            'element_space_size_': placeholder,
+            'ndim_hidden_': placeholder,
+            'ndim_top_': placeholder,
+            'ntransform_': _constant_field(transform_count) if transform_count else None,
+        }
+
+    def __getitem__(self, field_name):
+        try:
+            return self.members[field_name]
+        except KeyError:
+            raise gdb.error(f"No member named {field_name}")
+
+
+class _MockBufferView:
+    """buffer_view stand-in carrying only its type string."""
+
+    __slots__ = ('type',)
+
+    def __init__(self, type_str):
+        self.type = type_str
+
+
+class _MockBottomTensorView:
+    """tensor_view stand-in providing the desc_ and buf_view_ members TensorViewPrinter expects."""
+
+    __slots__ = ('type', 'members')
+
+    def __init__(self, type_str):
+        self.type = type_str
+        starts = _scan_templates(type_str)
+        desc_type = _slice_template(type_str, starts, 'tensor_descriptor')
+        buf_type = _slice_template(type_str, starts, 'buffer_view')
+
+        self.members = {}
+        if desc_type:
+            self.members['desc_'] = _MockViewDescriptor(desc_type)
+        if buf_type:
+            self.members['buf_view_'] = _MockBufferView(buf_type)
+
+    def __getitem__(self, field_name):
+        try:
+            return self.members[field_name]
+        except KeyError:
+            raise gdb.error(f"No member named {field_name}")
+
+
+class TileScatterGatherPrinter(BaseCKTilePrinter, ChildrenMixin):
     """Pretty-printer for tile_scatter_gather types."""
 
+    # Child name, marker the type must contain, and the method rendering it
+    _NESTED_CHILDREN = (
+        ('tile_distribution', 'tile_distribution<', '_render_distribution'),
+        ('bottom_tensor_view_', 'tensor_view<', '_render_bottom_view'),
+    )
+
+    def _nested_children(self):
+        """
+        Find the nested printers the type holds, without rendering them.
+
+        Returns:
+            (type string, list of (child name, render method)) tuple
+        """
+        type_str = self.value_type_str()
+        nested = [(name, getattr(self, render))
+                  for name, marker, render in self._NESTED_CHILDREN
+                  if marker in type_str]
+        return type_str, nested
+
+    def _render_children(self, start=0, end=None):
+        """
+        Render the nested printers in [start, end) one at a time.
+
+        The distribution and bottom view only exist in the type, so there is
+        no gdb.Value to hand out; the children are display-only strings. The
+        CLI prints them verbatim, MI front-ends show them as char arrays.
+
+        Args:
+            start: Index of the first child
+            end: Index past the last child (default: all)
+
+        Yields:
+            (name, rendered text) tuples
+        """
+        type_str, nested = self._nested_children()
+        for name, render in nested[start:end]:
+            text = render(type_str, '')
+            yield name, text if text is not None else '<unavailable>'
+
+    def children(self):
+        """Return the nested renders as children, formatted as they are read."""
+        if not self.structured_children():
+            return iter(())
+        return self._render_children()
+
+    def num_children(self):
+        """Return the number of children without formatting any of them."""
+        if not self.structured_children():
+            return 0
+        return len(self._nested_children()[1])
+
+    def children_range(self, start, end):
+        """
+        Return the children in [start, end) for paged front-ends.
+
+        Args:
+            start: Index of the first child
+            end: Index past the last child
+
+        Returns:
+            Iterator of (name, rendered text) tuples
+        """
+        if not self.structured_children():
+            return iter(())
+        return self._render_children(start, end)
+
     def to_string(self):
-        """Generate display string for tile_scatter_gather."""
+        """Generate display string for tile_scatter_gather (cached per type string)."""
+        try:
+            type_str = self.value_type_str()
+        except Exception as e:
+            return self.format_error(e, "tile_scatter_gather")
+
+        structured = self.structured_children()
+        key = (type_str, detail_level(), verbose_errors_enabled(), structured)
+        try:
+            return _RENDER_CACHE[key]
+        except KeyError:
+            pass
+
+        text = self._format(type_str, structured)
+        if len(_RENDER_CACHE) >= _MAX_RENDER_CACHE_ENTRIES:
+            _RENDER_CACHE.clear()
+        _RENDER_CACHE[key] = text
+        return text
+
+    def _format(self, type_str, structured=False):
+        """
+        Format a tile_scatter_gather from its type string.
+
+        Args:
+            type_str: Type string of the value
+            structured: True to leave the nested printers to children()
+
+        Returns:
+            Formatted string
+        """
         try:
-            type_str = str(self.val.type)
-            result = "tile_scatter_gather{\n"
+            parts = ["tile_scatter_gather{\n"]
 
             # Extract basic data type info (same as tile_window)
             data_type = self.extract_data_type(type_str)
             if data_type:
-                result += f"  data_type: {data_type}\n"
+                parts.append(f"  data_type: {data_type}\n")
 
             # Extract tile dimensions (same as tile_window)
-            dims_match = re.findall(r'constant<(\d+)>', type_str)
+            dims_match = _CONSTANT_RE.findall(type_str)
             if dims_match and len(dims_match) >= 2:
-                result += f"  tile_dims: [{dims_match[0]} x {dims_match[1]}]\n"
+                parts.append(f"  tile_dims: [{dims_match[0]} x {dims_match[1]}]\n")
 
             # Extract memory operation enum if present
-            mem_op_match = re.search(r'\(ck_tile::memory_operation_enum\)(\d+)', type_str)
+            mem_op_match = _MEMORY_OPERATION_RE.search(type_str)
             if mem_op_match:
                 mem_op = mem_op_match.group(1)
                 mem_ops = {'0': 'set', '1': 'atomic_add', '2': 'atomic_max'}
-                result += f"  memory_operation: {mem_ops.get(mem_op, f'op_{mem_op}')}\n"
-
-            # Since tile_scatter_gather stores distribution in its type (not as runtime member),
-            # we need to extract and display it from the type string
-            if 'tile_distribution<' in type_str:
-                from .tile_distribution import TileDistributionPrinter
-
-                # Create a mock value with the distribution type for the printer
-                # This allows us to reuse TileDistributionPrinter's full formatting
-                class MockDistribution:
-                    def __init__(self, type_str):
-                        self.type = type_str
-
-                        # Extract the tile_distribution<...> portion
-                        dist_start = type_str.find('tile_distribution<')
-                        if dist_start != -1:
-                            # Find the matching closing bracket
-                            pos = dist_start + len('tile_distribution<')
-                            bracket_count = 1
-                            end = pos
-                            while bracket_count > 0 and end < len(type_str):
-                                if type_str[end] == '<':
-                                    bracket_count += 1
-                                elif type_str[end] == '>':
-                                    bracket_count -= 1
-                                end += 1
-
-                            self.dist_type_str = type_str[dist_start:end]
-                        else:
-                            self.dist_type_str = type_str
-
-                        # Extract tensor_adaptor portion
-                        adaptor_start = self.dist_type_str.find('tensor_adaptor<')
-                        if adaptor_start != -1:
-                            pos = adaptor_start + len('tensor_adaptor<')
-                            bracket_count = 1
-                            end = pos
-                            while bracket_count > 0 and end < len(self.dist_type_str):
-                                if self.dist_type_str[end] == '<':
-                                    bracket_count += 1
-                                elif self.dist_type_str[end] == '>':
-                                    bracket_count -= 1
-                                end += 1
-                            self.adaptor_type_str = self.dist_type_str[adaptor_start:end]
-                        else:
-                            self.adaptor_type_str = None
-
-                        # Extract tensor_descriptor portion (look for the one that's part of ys_to_d_)
-                        # In tile_distribution, tensor_descriptor comes after tensor_adaptor
-                        desc_start = self.dist_type_str.rfind('tensor_descriptor<')  # Use rfind to get the last one
-                        if desc_start != -1:
-                            pos = desc_start + len('tensor_descriptor<')
-                            bracket_count = 1
-                            end = pos
-                            while bracket_count > 0 and end < len(self.dist_type_str):
-                                if self.dist_type_str[end] == '<':
-                                    bracket_count += 1
-                                elif self.dist_type_str[end] == '>':
-                                    bracket_count -= 1
-                                end += 1
-                            self.desc_type_str = self.dist_type_str[desc_start:end]
-                        else:
-                            self.desc_type_str = None
-
-                        # Mock ps_ys_to_xs_ and ys_to_d_ for TileDistributionPrinter
-                        self._fields = {}
-
-                    def __getitem__(self, key):
-                        # Mock accessing members - TileDistributionPrinter will extract from type
-                        if key == 'ps_ys_to_xs_':
-                            # Create mock tensor_adaptor that can handle printer expectations
-                            class MockAdaptor:
-                                def __init__(self, type_str):
-                                    self.type = type_str
-
-                                def __getitem__(self, field_name):
-                                    # Return None for any field access attempts
-                                    # This allows extract_int_from_field to gracefully fail
-                                    # and fall back to type string extraction
-                                    raise gdb.error(f"No member named {field_name}")
-
-                                def cast(self, target_type):
-                                    # Return self for any cast attempts
-                                    return self
-
-                            # Also need to provide a mock type with fields method
-                            class MockType:
-                                def __init__(self, type_str):
-                                    self._type_str = type_str
-
-                                def __str__(self):
-                                    return self._type_str
-
-                                def fields(self):
-                                    # Return empty list - no runtime fields in type aliases
-                                    return []
-
-                            # Return mock with the tensor_adaptor type
-                            if self.adaptor_type_str:
-                                adaptor = MockAdaptor(None)
-                                adaptor.type = MockType(self.adaptor_type_str)
-                                return adaptor
-                            else:
-                                # Fallback - return the full distribution type
-                                adaptor = MockAdaptor(None)
-                                adaptor.type = MockType(self.dist_type_str)
-                                return adaptor
-                        elif key == 'ys_to_d_':
-                            # Create mock tensor_descriptor that can handle printer expectations
-                            class MockDescriptor:
-                                def __init__(self, type_str):
-                                    self.type = type_str
-
-                                def __getitem__(self, field_name):
-                                    # Return None for any field access attempts
-                                    # This allows extract_int_from_field to gracefully fail
-                                    # and fall back to type string extraction
-                                    raise gdb.error(f"No member named {field_name}")
-
-                                def cast(self, target_type):
-                                    # Return self for any cast attempts
-                                    return self
-
-                            # Use the same MockType class defined above
-                            class MockType:
-                                def __init__(self, type_str):
-                                    self._type_str = type_str
-
-                                def __str__(self):
-                                    return self._type_str
-
-                                def fields(self):
-                                    # Return empty list - no runtime fields in type aliases
-                                    return []
-
-                            # Return mock with the tensor_descriptor type
-                            if self.desc_type_str:
-                                descriptor = MockDescriptor(None)
-                                descriptor.type = MockType(self.desc_type_str)
-                                return descriptor
-                            else:
-                                # Fallback - return the full distribution type
-                                descriptor = MockDescriptor(None)
-                                descriptor.type = MockType(self.dist_type_str)
-                                return descriptor
-                        else:
-                            raise gdb.error(f"No member named {key}")
-
-                mock_dist = MockDistribution(type_str)
-
-                # Use the actual TileDistributionPrinter
-                dist_printer = TileDistributionPrinter(mock_dist)
-                dist_str = dist_printer.to_string()
-
-                result += "\n  tile_distribution: "
-                result += dist_str.replace('\n', '\n  ')
-                result += "\n"
-
-            # Access bottom_tensor_view - EXACT same approach as tile_window
-            # tile_window does:
-            #   bottom_view = self.val['bottom_tensor_view_']
-            #   view_printer = TensorViewPrinter(bottom_view)
-            # We do the same but with a mock since it's a type alias
-            try:
-                from .tensor_view import TensorViewPrinter
-
-                # Extract the tensor_view type (first template parameter)
-                if 'tensor_view<' in type_str:
-                    view_start = type_str.find('tensor_view<')
-                    if view_start != -1:
-                        # Find the matching closing bracket
-                        pos = view_start + len('tensor_view<')
-                        bracket_count = 1
-                        end = pos
-                        while bracket_count > 0 and end < len(type_str):
-                            if type_str[end] == '<':
-                                bracket_count += 1
-                            elif type_str[end] == '>':
-                                bracket_count -= 1
-                            end += 1
-
-                        # Check if it has memory_operation_enum parameter
-                        if type_str[end:end+30].startswith(', (ck_tile::memory_operation_enum)'):
-                            mem_op_end = type_str.find('>', end + 30)
-                            if mem_op_end != -1:
-                                view_type_str = type_str[view_start:mem_op_end+1]
-                            else:
-                                view_type_str = type_str[view_start:end]
-                        else:
-                            view_type_str = type_str[view_start:end]
-
-                        # Create a mock bottom_tensor_view that provides the members TensorViewPrinter expects
-                        class MockBottomTensorView:
-                            def __init__(self, type_str):
-                                self.type = type_str
-                                self._parse_components(type_str)
-
-                            def _parse_components(self, type_str):
-                                """Parse out descriptor and buffer_view from the type"""
-                                # Extract descriptor type
-                                self._desc_type = None
-                                desc_start = type_str.find('tensor_descriptor<')
-                                if desc_start != -1:
-                                    pos = desc_start + len('tensor_descriptor<')
-                                    bracket_count = 1
-                                    end = pos
-                                    while bracket_count > 0 and end < len(type_str):
-                                        if type_str[end] == '<':
-                                            bracket_count += 1
-                                        elif type_str[end] == '>':
-                                            bracket_count -= 1
-                                        end += 1
-                                    self._desc_type = type_str[desc_start:end]
-
-                                # Extract buffer_view type
-                                self._buf_type = None
-                                buf_start = type_str.find('buffer_view<')
-                                if buf_start != -1:
-                                    pos = buf_start + len('buffer_view<')
-                                    bracket_count = 1
-                                    end = pos
-                                    while bracket_count > 0 and end < len(type_str):
-                                        if type_str[end] == '<':
-                                            bracket_count += 1
-                                        elif type_str[end] == '>':
-                                            bracket_count -= 1
-                                        end += 1
-                                    self._buf_type = type_str[buf_start:end]
-
-                            def __getitem__(self, field_name):
-                                # Provide mock desc_ and buf_view_ that TensorViewPrinter expects
-                                if field_name == 'desc_' and self._desc_type:
-                                    # Return a mock descriptor that provides the fields TensorDescriptorPrinter needs
-                                    class MockDescriptor:
-                                        def __init__(self, type_str):
-                                            self.type = type_str
-                                            self._analyze_type(type_str)
-
-                                        def _analyze_type(self, type_str):
-                                            """Analyze the descriptor type to extract info"""
-                                            self._has_transforms = ('embed<' in type_str or
-                                                                   'pass_through<' in type_str or
-                                                                   'unmerge<' in type_str or
-                                                                   'merge<' in type_str)
-                                            # Count transforms
-                                            self._transform_count = 0
-                                            for t in ['embed<', 'pass_through<', 'unmerge<', 'merge<']:
-                                                self._transform_count += type_str.count(t)
-
-                                        def __getitem__(self, field_name):
-                                            # Provide mock fields that TensorDescriptorPrinter expects
-                                            if field_name == 'element_space_size_':
-                                                # Return a mock constant - any non-None value prevents UNINITIALIZED
-                                                class MockField:
-                                                    def __init__(self):
-                                                        self.type = 'ck_tile::constant<1>'
-                                                return MockField()
-                                            elif field_name == 'ntransform_':
-                                                if self._has_transforms:
-                                                    class MockField:
-                                                        def __init__(self, val):
-                                                            self.type = f'ck_tile::constant<{val}>'
-                                                            self._val = val
-                                                        def __int__(self):
-                                                            return self._val
-                                                    return MockField(self._transform_count)
-                                                else:
-                                                    return None
-                                            elif field_name in ['ndim_hidden_', 'ndim_top_']:
-                                                # Return something to prevent UNINITIALIZED
-                                                class MockField:
-                                                    def __init__(self):
-                                                        self.type = 'ck_tile::constant<1>'
-                                                return MockField()
-                                            else:
-                                                # For other fields, return None or raise error
-                                                raise gdb.error(f"No member named {field_name}")
-
-                                    return MockDescriptor(self._desc_type)
-
-                                elif field_name == 'buf_view_' and self._buf_type:
-                                    # Return a mock buffer_view
-                                    class MockBufferView:
-                                        def __init__(self, type_str):
-                                            self.type = type_str
-
-                                    return MockBufferView(self._buf_type)
-
-                                else:
-                                    raise gdb.error(f"No member named {field_name}")
-
-                        bottom_view = MockBottomTensorView(view_type_str)
-
-                        # Use tensor_view printer - EXACTLY like tile_window does
-                        view_printer = TensorViewPrinter(bottom_view)
-                        view_str = view_printer.to_string()
-
-                        result += "\n  bottom_tensor_view_: "
-                        result += view_str.replace('\n', '\n  ')
-                        result += "\n"
-
-            except:
-                pass  # Same as tile_window - silently ignore errors
-
-            result += "}"
-            return result
+                parts.append(f"  memory_operation: {mem_ops.get(mem_op, f'op_{mem_op}')}\n")
 
-        except Exception as e:
-            return self.format_error(str(e), "tile_scatter_gather")
+            # Nested printers are shown as children on demand, or not at all
+            # below full detail
+            if structured or detail_level() != 'full':
+                parts.append("}")
+                return "".join(parts)
 
-    def children(self):
-        """Return child elements for hierarchical display."""
-        # tile_scatter_gather doesn't have runtime members we can access
-        # Everything is in the type template parameters
-        return []
+            dist_str = self._render_distribution(type_str, '  ')
+            if dist_str is not None:
+                parts.append("\n  tile_distribution: ")
+                parts.append(dist_str)
+                parts.append("\n")
+
+            view_str = self._render_bottom_view(type_str, '  ')
+            if view_str is not None:
+                parts.append("\n  bottom_tensor_view_: ")
+                parts.append(view_str)
+                parts.append("\n")
+
+            parts.append("}")
+            return "".join(parts)
+
+        except Exception as e:
+            return self.format_error(e, "tile_scatter_gather")
+
+    def _render_distribution(self, type_str, indent):
+        """
+        Render the tile_distribution held in the type with TileDistributionPrinter.
+
+        Since tile_scatter_gather stores distribution in its type (not as
+        runtime member), a mock value carrying the distribution type lets the
+        printer's full formatting be reused.
+
+        Args:
+            type_str: Type string of the value
+            indent: Indentation the output is embedded at
+
+        Returns:
+            Rendered text, or None if the type has no tile_distribution
+        """
+        if 'tile_distribution<' not in type_str:
+            return None
+
+        from .tile_distribution import TileDistributionPrinter
+
+        dist_printer = TileDistributionPrinter(_MockDistribution(type_str))
+        return self.render_child(dist_printer, indent)
+
+    def _render_bottom_view(self, type_str, indent):
+        """
+        Render the bottom tensor_view held in the type with TensorViewPrinter.
+
+        This is the same approach as tile_window, which prints its
+        bottom_tensor_view_ member, but with a mock since it's a type alias.
+
+        Args:
+            type_str: Type string of the value
+            indent: Indentation the output is embedded at
+
+        Returns:
+            Rendered text, or None if there is no tensor_view or it fails to print
+        """
+        # Extract the tensor_view type (first template parameter)
+        view_start = type_str.find('tensor_view<')
+        if view_start == -1:
+            return None
+
+        from .tensor_view import TensorViewPrinter
+
+        # Find the matching closing bracket
+        pos = view_start + len('tensor_view<')
+        end = find_template_end(type_str, pos)
+
+        # Check if it has memory_operation_enum parameter
+        if type_str[end:end+30].startswith(', (ck_tile::memory_operation_enum)'):
+            mem_op_end = type_str.find('>', end + 30)
+            if mem_op_end != -1:
+                view_type_str = type_str[view_start:mem_op_end+1]
+            else:
+                view_type_str = type_str[view_start:end]
+        else:
+            view_type_str = type_str[view_start:end]
+
+        bottom_view = _MockBottomTensorView(view_type_str)
+
+        # Use tensor_view printer - EXACTLY like tile_window does
+        view_printer = TensorViewPrinter(bottom_view)
+        try:
+            return self.render_child(view_printer, indent)
+        except (gdb.error, AttributeError):
+            return None  # Same as tile_window - leave the view out if it cannot be printed
 
     def display_hint(self):
         """Return display hint for GDB."""
-        return 'map'
\ No newline at end of file
+        # Children are (name, value) pairs, not alternating keys and values
+        return None if self.structured_children() else 'map'
@@ -2,34 +2,30 @@
 Constants used throughout CK-Tile pretty printers.
 """
 
-# Transform patterns - order matters for matching
-# Each tuple is (type_string_pattern, display_name)
-TRANSFORM_PATTERNS = [
-    ('ck_tile::embed<', 'embed'),
-    ('embed<', 'embed'),
-    ('ck_tile::unmerge<', 'unmerge'),
-    ('unmerge<', 'unmerge'),
-    ('ck_tile::merge_v2_magic_division<', 'merge_v2'),
-    ('merge_v2_magic_division<', 'merge_v2'),
-    ('ck_tile::merge<', 'merge'),
-    ('merge<', 'merge'),
-    ('ck_tile::replicate<', 'replicate'),
-    ('replicate<', 'replicate'),
-    ('ck_tile::xor_t<', 'xor'),
-    ('xor_t<', 'xor'),
-    ('ck_tile::pass_through<', 'pass_through'),
-    ('pass_through<', 'pass_through'),
-    ('ck_tile::pad<', 'pad'),
-    ('pad<', 'pad'),
-    ('ck_tile::right_pad<', 'right_pad'),
-    ('right_pad<', 'right_pad'),
-    ('ck_tile::left_pad<', 'left_pad'),
-    ('left_pad<', 'left_pad'),
-    ('ck_tile::slice<', 'slice'),
-    ('slice<', 'slice'),
-    ('ck_tile::freeze<', 'freeze'),
-    ('freeze<', 'freeze'),
-]
+import re
+
+# Transform template names -> display names. Type strings spell them with or
+# without the ck_tile:: prefix; TRANSFORM_RE accepts both.
+TRANSFORM_NAMES = {
+    'embed': 'embed',
+    'unmerge': 'unmerge',
+    'merge_v2_magic_division': 'merge_v2',
+    'merge': 'merge',
+    'replicate': 'replicate',
+    'xor_t': 'xor',
+    'pass_through': 'pass_through',
+    'pad': 'pad',
+    'right_pad': 'right_pad',
+    'left_pad': 'left_pad',
+    'slice': 'slice',
+    'freeze': 'freeze',
+}
+
+# Any transform opening, for single-pass scans. Group 1 is the template name
+# (a key of TRANSFORM_NAMES).
+TRANSFORM_RE = re.compile(
+    r'(?:ck_tile::)?(' + '|'.join(re.escape(name) for name in TRANSFORM_NAMES) + r')<'
+)
 
 # Sanity check for detecting uninitialized values
 # Values larger than this are likely garbage/uninitialized
@@ -38,6 +34,9 @@ MAX_SANE_VALUE = 100_000_000
 # Default maximum dimensions to read when we can't determine the exact count
 DEFAULT_MAX_DIMS = 20
 
+# Type strings longer than this are not parsed for encodings (pathological templates)
+MAX_PARSED_TYPE_LENGTH = 1_000_000
+
 # Numeric types that should be converted to Python int
 NUMERIC_TYPES = [
     'int',
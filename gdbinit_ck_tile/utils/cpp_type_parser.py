@@ -4,6 +4,57 @@ Provides robust bracket counting and template parameter extraction.
 """
 
 import re
+from functools import lru_cache
+
+from .constants import TRANSFORM_NAMES, TRANSFORM_RE
+from .type_cache import register_cache
+
+# Signed integer literal, as found in sequence<...> and dimension lists
+_INT_RE = re.compile(r'-?\d+')
+
+# Angle brackets, for building bracket-pair maps
+_ANGLE_BRACKET_RE = re.compile(r'[<>]')
+
+# Characters that end or nest a template parameter
+_PARAM_DELIMITER_RE = re.compile(r'[<>,]')
+
+# Value of a ck_tile::constant<N> (with optional integer suffix)
+_CONSTANT_VALUE_RE = re.compile(r'constant<(\d+)[uUlL]*>')
+
+# Entries kept by each memoized parser below. Type strings are large but a
+# session only sees a few distinct ones, and printers re-parse the same
+# substrings of them over and over.
+_PARSE_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=256)
+def build_bracket_map(text):
+    """
+    Map every '<' in text to the position of its matching '>'.
+
+    The brackets are located by one regex scan and paired with a stack, so
+    any number of matching-bracket lookups on the same string cost a single
+    pass plus dict lookups. Results are cached per string.
+
+    Args:
+        text: The string to scan
+
+    Returns:
+        Dict of open bracket position -> matching close bracket position.
+        Unmatched open brackets are absent.
+    """
+    pairs = {}
+    stack = []
+    for match in _ANGLE_BRACKET_RE.finditer(text):
+        pos = match.start()
+        if text[pos] == '<':
+            stack.append(pos)
+        elif stack:
+            pairs[stack.pop()] = pos
+    return pairs
+
+
+register_cache(build_bracket_map.cache_clear)
 
 
 def find_matching_bracket(text, start_pos, open_char='<', close_char='>'):
@@ -19,19 +70,94 @@ def find_matching_bracket(text, start_pos, open_char='<', close_char='>'):
     Returns:
         Position of matching closing bracket, or -1 if not found
     """
-    bracket_count = 1
+    if open_char == '<' and close_char == '>' and text[start_pos:start_pos + 1] == '<':
+        return build_bracket_map(text).get(start_pos, -1)
+
+    # Jump between brackets with str.find instead of stepping per character
+    depth = 1
     pos = start_pos + 1
+    next_close = text.find(close_char, pos)
 
-    while pos < len(text) and bracket_count > 0:
-        if text[pos] == open_char:
-            bracket_count += 1
-        elif text[pos] == close_char:
-            bracket_count -= 1
-        pos += 1
+    while next_close != -1:
+        next_open = text.find(open_char, pos, next_close)
+        if next_open != -1:
+            depth += 1
+            pos = next_open + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return next_close
+        pos = next_close + 1
+        next_close = text.find(close_char, pos)
+
+    return -1
 
-    return pos - 1 if bracket_count == 0 else -1
 
+def find_template_end(text, content_start):
+    """
+    Find the end of a template argument list.
+
+    Args:
+        text: The string to search
+        content_start: Position just after the opening '<'
+
+    Returns:
+        Position just past the matching '>', or len(text) if it is unmatched
+    """
+    close = find_matching_bracket(text, content_start - 1)
+    return close + 1 if close != -1 else len(text)
 
+
+def find_param_end(text, pos):
+    """
+    Find the end of the template parameter starting at pos.
+
+    Nested template argument lists are skipped as a whole, so only the
+    parameter's own delimiters are inspected.
+
+    Args:
+        text: The string to search
+        pos: Position where the parameter starts
+
+    Returns:
+        Position of the ',' or unmatched '>' ending the parameter, or
+        len(text) if neither is found
+    """
+    pairs = None
+    match = _PARAM_DELIMITER_RE.search(text, pos)
+    while match is not None:
+        delim_pos = match.start()
+        if text[delim_pos] != '<':
+            return delim_pos
+        if pairs is None:
+            pairs = build_bracket_map(text)
+        close = pairs.get(delim_pos)
+        if close is None:
+            break
+        match = _PARAM_DELIMITER_RE.search(text, close + 1)
+    return len(text)
+
+
+def count_transforms(type_str):
+    """
+    Count the transforms of each kind named anywhere in a type string.
+
+    One regex pass replaces a str.count() scan per transform pattern.
+
+    Args:
+        type_str: The string to scan
+
+    Returns:
+        Dict of transform display name (e.g., 'unmerge') -> occurrences
+    """
+    counts = {}
+    for match in TRANSFORM_RE.finditer(type_str):
+        name = TRANSFORM_NAMES[match.group(1)]
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def extract_template_content(type_str, template_name):
     """
     Extract the content between angle brackets of a template.
@@ -47,14 +173,13 @@ def extract_template_content(type_str, template_name):
         extract_template_content("tensor_descriptor<int, float>", "tensor_descriptor")
         -> "int, float"
     """
-    # Find template start
-    pattern = re.escape(template_name) + r'<'
-    match = re.search(pattern, type_str)
+    # Find template start (a plain substring, so no regex is needed)
+    name_pos = type_str.find(template_name + '<')
 
-    if not match:
+    if name_pos == -1:
         return ""
 
-    start = match.end() - 1  # Position of '<'
+    start = name_pos + len(template_name)  # Position of '<'
     end = find_matching_bracket(type_str, start, '<', '>')
 
     if end == -1:
@@ -78,26 +203,24 @@ def split_template_params(content):
         -> ["int", "tuple<float, double>", "bool"]
     """
     params = []
-    current_param = []
     bracket_count = 0
+    param_start = 0
 
-    for char in content:
+    # Only visit brackets and commas; everything else is sliced out whole
+    for match in _PARAM_DELIMITER_RE.finditer(content):
+        char = match.group()
         if char == '<':
             bracket_count += 1
-            current_param.append(char)
         elif char == '>':
             bracket_count -= 1
-            current_param.append(char)
-        elif char == ',' and bracket_count == 0:
+        elif bracket_count == 0:
             # End of parameter
-            params.append(''.join(current_param).strip())
-            current_param = []
-        else:
-            current_param.append(char)
+            params.append(content[param_start:match.start()].strip())
+            param_start = match.end()
 
     # Add last parameter
-    if current_param:
-        params.append(''.join(current_param).strip())
+    if param_start < len(content):
+        params.append(content[param_start:].strip())
 
     return params
 
@@ -116,30 +239,28 @@ def extract_sequences(content):
         extract_sequences("sequence<1, 2>, other, sequence<3>")
         -> ["1, 2", "3"]
     """
-    sequences = []
-    pos = 0
+    # Copy so callers may modify the result without touching the cache
+    return list(_extract_sequences(content))
 
-    while pos < len(content):
-        # Look for sequence<
-        seq_patterns = ['ck_tile::sequence<', 'sequence<']
-        found = False
 
-        for pattern in seq_patterns:
-            if content[pos:].startswith(pattern):
-                start = pos + len(pattern) - 1  # Position of '<'
-                end = find_matching_bracket(content, start, '<', '>')
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _extract_sequences(content):
+    """Memoized body of extract_sequences, returning a tuple."""
+    sequences = []
+    # 'ck_tile::sequence<' ends in 'sequence<', so one find covers both spellings
+    match_pos = content.find('sequence<')
 
-                if end != -1:
-                    seq_content = content[start + 1:end].strip()
-                    sequences.append(seq_content)
-                    pos = end + 1
-                    found = True
-                    break
+    while match_pos != -1:
+        start = match_pos + len('sequence<') - 1  # Position of '<'
+        end = find_matching_bracket(content, start, '<', '>')
 
-        if not found:
-            pos += 1
+        if end != -1:
+            sequences.append(content[start + 1:end].strip())
+            match_pos = content.find('sequence<', end + 1)
+        else:
+            match_pos = content.find('sequence<', match_pos + 1)
 
-    return sequences
+    return tuple(sequences)
 
 
 def extract_tuples(content):
@@ -156,32 +277,31 @@ def extract_tuples(content):
         extract_tuples("tuple<int, float>, other, tuple<double>")
         -> ["int, float", "double"]
     """
-    tuples = []
-    pos = 0
+    # Copy so callers may modify the result without touching the cache
+    return list(_extract_tuples(content))
 
-    while pos < len(content):
-        # Look for tuple<
-        tuple_patterns = ['ck_tile::tuple<', 'tuple<']
-        found = False
 
-        for pattern in tuple_patterns:
-            if content[pos:].startswith(pattern):
-                start = pos + len(pattern) - 1  # Position of '<'
-                end = find_matching_bracket(content, start, '<', '>')
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _extract_tuples(content):
+    """Memoized body of extract_tuples, returning a tuple."""
+    tuples = []
+    # 'ck_tile::tuple<' ends in 'tuple<', so one find covers both spellings
+    match_pos = content.find('tuple<')
 
-                if end != -1:
-                    tuple_content = content[start + 1:end]
-                    tuples.append(tuple_content)
-                    pos = end + 1
-                    found = True
-                    break
+    while match_pos != -1:
+        start = match_pos + len('tuple<') - 1  # Position of '<'
+        end = find_matching_bracket(content, start, '<', '>')
 
-        if not found:
-            pos += 1
+        if end != -1:
+            tuples.append(content[start + 1:end])
+            match_pos = content.find('tuple<', end + 1)
+        else:
+            match_pos = content.find('tuple<', match_pos + 1)
 
-    return tuples
+    return tuple(tuples)
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def extract_constant_value(type_str):
     """
     Extract the numeric value from a ck_tile::constant<N> type.
@@ -196,7 +316,7 @@ def extract_constant_value(type_str):
         extract_constant_value("ck_tile::constant<8192l>") -> 8192
         extract_constant_value("int") -> None
     """
-    match = re.search(r'constant<(\d+)[uUlL]*>', type_str)
+    match = _CONSTANT_VALUE_RE.search(type_str)
     if match:
         return int(match.group(1))
     return None
@@ -216,14 +336,21 @@ def parse_sequence_values(seq_content):
         parse_sequence_values("1, 2, 3") -> [1, 2, 3]
         parse_sequence_values("") -> []
     """
-    if not seq_content.strip():
-        return []
+    # Copy so callers may modify the result without touching the cache
+    return list(_sequence_values(seq_content))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _sequence_values(seq_content):
+    """Memoized body of parse_sequence_values, returning a tuple."""
+    # Plain "1, 2, 3" lists (int() ignores the spaces) need no regex
+    try:
+        return tuple(map(int, seq_content.split(',')))
+    except ValueError:
+        # Empty content or suffixed literals: pick out every (possibly negative) integer
+        return tuple(map(int, _INT_RE.findall(seq_content)))
 
-    values = []
-    for val in seq_content.split(','):
-        val = val.strip()
-        # Handle negative numbers too
-        if val and val.lstrip('-').isdigit():
-            values.append(int(val))
 
-    return values
+for _parser in (extract_template_content, _extract_sequences, _extract_tuples,
+                extract_constant_value, _sequence_values):
+    register_cache(_parser.cache_clear)
@@ -6,6 +6,37 @@ Eliminates duplication between descriptor and adaptor diagram generation.
 from typing import List, Dict, Any
 
 
+# Node shape per transform type, as str.format templates
+_LABEL_TEMPLATES = {
+    # Diamond for splitting transforms
+    'embed': '{{"[{index}] {name}<br/>[{lower}] → [{upper}]"}}',
+    'unmerge': '{{"[{index}] {name}<br/>[{lower}] → [{upper}]"}}',
+    # Diamond for merging transforms
+    'merge': '{{"[{index}] {name}<br/>[{lower}] → [{upper}]"}}',
+    'merge_v2': '{{"[{index}] {name}<br/>[{lower}] → [{upper}]"}}',
+    # Special shape for xor
+    'xor': '[["[{index}] XOR<br/>[{lower}] → [{upper}]"]]',
+}
+# Rectangle for others (pass_through, replicate, pad, etc.)
+_DEFAULT_LABEL_TEMPLATE = '["[{index}] {name}<br/>[{lower}] → [{upper}]"]'
+
+_TRANSFORM_COLORS = {
+    'embed': '#fff3e0',
+    'unmerge': '#fce4ec',
+    'merge': '#e8f5e9',
+    'merge_v2': '#e8f5e9',
+    'pass_through': '#f3e5f5',
+    'replicate': '#e3f2fd',
+    'xor': '#ffebee',
+    'xor_t': '#ffebee',
+    'pad': '#fff9c4',
+    'right_pad': '#fff9c4',
+    'left_pad': '#fff9c4',
+    'slice': '#efebe9',
+    'freeze': '#eceff1',
+}
+
+
 class MermaidDiagramBuilder:
     """
     Builds Mermaid diagrams from transform data.
@@ -37,25 +68,28 @@ class MermaidDiagramBuilder:
         Returns:
             Complete Mermaid diagram as a string
         """
-        self.lines = ["```mermaid", "graph TD"]
+        lines = self.lines = ["```mermaid", "graph TD"]
+        # Bound once; called several times per transform and dimension
+        append = lines.append
 
         # Add title
-        self.lines.append(f"    %% {title}")
-        self.lines.append("")
+        append(f"    %% {title}")
+        append("")
 
         # Track current dimension mapping - maps dimension ID to its node name
         current_dims = {}
 
-        # Track which bottom dimensions have been consumed
-        unconsumed_bottom_dims = list(bottom_dims) if bottom_dims else []
+        # Track which bottom dimensions have been consumed. A dict keeps them
+        # in order (for "first unconsumed") with O(1) membership and removal.
+        unconsumed_bottom_dims = dict.fromkeys(bottom_dims) if bottom_dims else {}
 
         # Add bottom dimensions
         if bottom_dims:
             for dim in bottom_dims:
                 current_dims[dim] = f"B{dim}"
-                self.lines.append(f'    B{dim}["Bottom[{dim}]"]')
-                self.lines.append(f"    style B{dim} fill:#e1f5fe")
-            self.lines.append("")
+                append(f'    B{dim}["Bottom[{dim}]"]')
+                append(f"    style B{dim} fill:#e1f5fe")
+            append("")
 
         # Process each transform
         for i, (transform, lower, upper) in enumerate(zip(transforms, lower_dims, upper_dims)):
@@ -64,33 +98,32 @@ class MermaidDiagramBuilder:
             # Create transform node
             label = self._format_transform_label(transform, i, lower, upper)
             color = self._get_transform_color(transform)
-            self.lines.append(f"    {transform_node}{label}")
-            self.lines.append(f"    style {transform_node} fill:{color}")
+            append(f"    {transform_node}{label}")
+            append(f"    style {transform_node} fill:{color}")
 
             # Connect inputs to transform (lower dimensions)
             if not lower and unconsumed_bottom_dims:
                 # Special case: empty lower dims (e.g., replicate)
                 # Connect to the first unconsumed bottom dimension
-                dim = unconsumed_bottom_dims[0]
+                dim = next(iter(unconsumed_bottom_dims))
                 if dim in current_dims:
-                    self.lines.append(f"    {current_dims[dim]} --> {transform_node}")
-                    unconsumed_bottom_dims.remove(dim)
+                    append(f"    {current_dims[dim]} --> {transform_node}")
+                    del unconsumed_bottom_dims[dim]
                     # Don't remove from current_dims yet, as it's not in lower
             else:
                 for dim in lower:
                     if dim in current_dims:
-                        self.lines.append(f"    {current_dims[dim]} --> {transform_node}")
+                        append(f"    {current_dims[dim]} --> {transform_node}")
                     # Mark bottom dims as consumed
-                    if dim in unconsumed_bottom_dims:
-                        unconsumed_bottom_dims.remove(dim)
+                    unconsumed_bottom_dims.pop(dim, None)
 
             # Create output dimensions and update mapping
             new_dims = {}
             for j, dim in enumerate(upper):
                 out_node = f"D{i}_{j}"
                 new_dims[dim] = out_node
-                self.lines.append(f'    {out_node}["Dim[{dim}]"]')
-                self.lines.append(f"    {transform_node} --> {out_node}")
+                append(f'    {out_node}["Dim[{dim}]"]')
+                append(f"    {transform_node} --> {out_node}")
 
             # Update current dimension mapping
             # Remove consumed dimensions
@@ -100,24 +133,25 @@ class MermaidDiagramBuilder:
             # Add new dimensions
             current_dims.update(new_dims)
 
-            self.lines.append("")
+            append("")
 
         # Connect to top dimensions
         if top_dims:
-            self.lines.append("    %% Top Dimensions")
+            append("    %% Top Dimensions")
             for dim in top_dims:
                 # Use consistent naming: X for adaptor, T for descriptor (backward compat)
                 top_node = f"X{dim}"
-                self.lines.append(f'    {top_node}["Top[{dim}]"]')
-                self.lines.append(f"    style {top_node} fill:#c8e6c9")
+                append(f'    {top_node}["Top[{dim}]"]')
+                append(f"    style {top_node} fill:#c8e6c9")
                 if dim in current_dims:
-                    self.lines.append(f"    {current_dims[dim]} --> {top_node}")
+                    append(f"    {current_dims[dim]} --> {top_node}")
 
-        self.lines.append("```")
-        return "\n".join(self.lines)
+        append("```")
+        return "\n".join(lines)
 
-    def _format_transform_label(self, transform: str, index: int,
-                               lower: List[int], upper: List[int]) -> str:
+    @staticmethod
+    def _format_transform_label(transform: str, index: int,
+                                lower: List[int], upper: List[int]) -> str:
         """
         Format transform label for Mermaid node.
 
@@ -130,24 +164,13 @@ class MermaidDiagramBuilder:
         Returns:
             Formatted label string
         """
-        lower_str = ','.join(map(str, lower))
-        upper_str = ','.join(map(str, upper))
-
-        # Use different shapes based on transform type
-        if transform in ['embed', 'unmerge']:
-            # Diamond for splitting transforms
-            return f'{{"[{index}] {transform}<br/>[{lower_str}] → [{upper_str}]"}}'
-        elif transform in ['merge', 'merge_v2']:
-            # Diamond for merging transforms
-            return f'{{"[{index}] {transform}<br/>[{lower_str}] → [{upper_str}]"}}'
-        elif transform == 'xor':
-            # Special shape for xor
-            return f'[["[{index}] XOR<br/>[{lower_str}] → [{upper_str}]"]]'
-        else:
-            # Rectangle for others (pass_through, replicate, pad, etc.)
-            return f'["[{index}] {transform}<br/>[{lower_str}] → [{upper_str}]"]'
-
-    def _get_transform_color(self, transform: str) -> str:
+        template = _LABEL_TEMPLATES.get(transform, _DEFAULT_LABEL_TEMPLATE)
+        return template.format(index=index, name=transform,
+                               lower=','.join(map(str, lower)),
+                               upper=','.join(map(str, upper)))
+
+    @staticmethod
+    def _get_transform_color(transform: str) -> str:
         """
         Get color for transform type.
 
@@ -157,19 +180,4 @@ class MermaidDiagramBuilder:
         Returns:
             Color code for the transform
         """
-        colors = {
-            'embed': '#fff3e0',
-            'unmerge': '#fce4ec',
-            'merge': '#e8f5e9',
-            'merge_v2': '#e8f5e9',
-            'pass_through': '#f3e5f5',
-            'replicate': '#e3f2fd',
-            'xor': '#ffebee',
-            'xor_t': '#ffebee',
-            'pad': '#fff9c4',
-            'right_pad': '#fff9c4',
-            'left_pad': '#fff9c4',
-            'slice': '#efebe9',
-            'freeze': '#eceff1',
-        }
-        return colors.get(transform, '#f5f5f5')
\ No newline at end of file
+        return _TRANSFORM_COLORS.get(transform, '#f5f5f5')
@@ -6,6 +6,110 @@ Consolidates duplicated parsing logic from mermaid_generator.py and test files.
 import re
 from typing import List, Tuple, Dict, Any, Optional
 
+from .cpp_type_parser import parse_sequence_values
+
+# Transform header line such as "[0] replicate" (used with match())
+_TRANSFORM_HEADER_RE = re.compile(r'\[(\d+)\]\s+(\w+)')
+
+# Bracketed lists on a transform's parameter lines
+_LOWER_RE = re.compile(r'lower:\s*\[([^\]]*)\]')
+_UPPER_RE = re.compile(r'upper:\s*\[([^\]]*)\]')
+_UP_LENGTHS_RE = re.compile(r'up_lengths:\s*\[([^\]]*)\]')
+_LOW_LENGTHS_RE = re.compile(r'low_lengths:\s*\[([^\]]*)\]')
+_LENGTHS_RE = re.compile(r'lengths:\s*\[([^\]]*)\]')
+
+# Integer list on a bottom_dimension_ids / top_dimension_ids line
+_DIMENSION_IDS_RE = re.compile(r'\[([\d,\s-]+)\]')
+
+_NTRANSFORM_RE = re.compile(r'ntransform:\s*(\d+)')
+
+
+def _parse_output(output: str) -> Tuple[List[Dict[str, Any]], List[int], List[int]]:
+    """
+    Parse transforms and bottom/top dimension IDs in one walk over the output.
+
+    Args:
+        output: Pretty printer output string
+
+    Returns:
+        Tuple of (transforms, bottom_dims, top_dims); see
+        PrettyPrinterOutputParser.parse_transforms and parse_bottom_top_dims
+    """
+    transforms = []
+    bottom_dims = []
+    top_dims = []
+
+    # Parameters of the transform whose lines are being read, if any
+    current = None
+
+    for line in output.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        # Look for transform marker like "[0] replicate" or "[1] unmerge"
+        transform_match = _TRANSFORM_HEADER_RE.match(line)
+        if transform_match:
+            current = {
+                'index': int(transform_match.group(1)),
+                'name': transform_match.group(2),
+                'lower': [],
+                'upper': [],
+                'parameters': {}
+            }
+            transforms.append(current)
+
+        elif current is not None:
+            if line.startswith('}'):
+                # A closing brace ends the transform's parameters
+                current = None
+            else:
+                # Extract lower dimension
+                if 'lower:' in line:
+                    lower_match = _LOWER_RE.search(line)
+                    if lower_match:
+                        lower_str = lower_match.group(1).strip()
+                        if lower_str:
+                            current['lower'] = parse_sequence_values(lower_str)
+
+                # Extract upper dimension
+                if 'upper:' in line:
+                    upper_match = _UPPER_RE.search(line)
+                    if upper_match:
+                        upper_str = upper_match.group(1).strip()
+                        if upper_str:
+                            current['upper'] = parse_sequence_values(upper_str)
+
+                # Extract other parameters (lengths, etc.)
+                parameters = current['parameters']
+                if 'up_lengths:' in line:
+                    match = _UP_LENGTHS_RE.search(line)
+                    if match:
+                        parameters['up_lengths'] = match.group(1)
+
+                if 'low_lengths:' in line:
+                    match = _LOW_LENGTHS_RE.search(line)
+                    if match:
+                        parameters['low_lengths'] = match.group(1)
+
+                if 'lengths:' in line and 'up_lengths' not in line and 'low_lengths' not in line:
+                    match = _LENGTHS_RE.search(line)
+                    if match:
+                        parameters['lengths'] = match.group(1)
+
+        # Dimension IDs may appear on any line; the last occurrence wins
+        if 'bottom_dimension_ids:' in line:
+            match = _DIMENSION_IDS_RE.search(line)
+            if match:
+                bottom_dims = parse_sequence_values(match.group(1))
+
+        if 'top_dimension_ids:' in line:
+            match = _DIMENSION_IDS_RE.search(line)
+            if match:
+                top_dims = parse_sequence_values(match.group(1))
+
+    return transforms, bottom_dims, top_dims
+
 
 class PrettyPrinterOutputParser:
     """
@@ -28,81 +132,7 @@ class PrettyPrinterOutputParser:
                 - upper: List of upper dimension indices
                 - parameters: Dict of additional parameters
         """
-        transforms = []
-        lines = output.split('\n')
-
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
-            # Look for transform marker like "[0] replicate" or "[1] unmerge"
-            transform_match = re.search(r'^\[(\d+)\]\s+(\w+)', line)
-            if transform_match:
-                transform_index = int(transform_match.group(1))
-                transform_name = transform_match.group(2)
-
-                # Collect parameters for this transform
-                current_lower = []
-                current_upper = []
-                parameters = {}
-
-                j = i + 1
-                while j < len(lines):
-                    param_line = lines[j].strip()
-
-                    # Stop if we hit another transform or closing brace
-                    if re.search(r'^\[(\d+)\]\s+\w+', param_line) or param_line.startswith('}'):
-                        break
-
-                    # Extract lower dimension
-                    if 'lower:' in param_line:
-                        lower_match = re.search(r'lower:\s*\[([^\]]*)\]', param_line)
-                        if lower_match:
-                            lower_str = lower_match.group(1).strip()
-                            if lower_str:
-                                current_lower = [int(x.strip()) for x in lower_str.split(',')
-                                               if x.strip().lstrip('-').isdigit()]
-
-                    # Extract upper dimension
-                    if 'upper:' in param_line:
-                        upper_match = re.search(r'upper:\s*\[([^\]]*)\]', param_line)
-                        if upper_match:
-                            upper_str = upper_match.group(1).strip()
-                            if upper_str:
-                                current_upper = [int(x.strip()) for x in upper_str.split(',')
-                                               if x.strip().lstrip('-').isdigit()]
-
-                    # Extract other parameters (lengths, etc.)
-                    if 'up_lengths:' in param_line:
-                        match = re.search(r'up_lengths:\s*\[([^\]]*)\]', param_line)
-                        if match:
-                            parameters['up_lengths'] = match.group(1)
-
-                    if 'low_lengths:' in param_line:
-                        match = re.search(r'low_lengths:\s*\[([^\]]*)\]', param_line)
-                        if match:
-                            parameters['low_lengths'] = match.group(1)
-
-                    if 'lengths:' in param_line and 'up_lengths' not in param_line and 'low_lengths' not in param_line:
-                        match = re.search(r'lengths:\s*\[([^\]]*)\]', param_line)
-                        if match:
-                            parameters['lengths'] = match.group(1)
-
-                    j += 1
-
-                transforms.append({
-                    'index': transform_index,
-                    'name': transform_name,
-                    'lower': current_lower,
-                    'upper': current_upper,
-                    'parameters': parameters
-                })
-
-                i = j
-            else:
-                i += 1
-
-        return transforms
+        return _parse_output(output)[0]
 
     @staticmethod
     def parse_bottom_top_dims(output: str) -> Tuple[List[int], List[int]]:
@@ -115,24 +145,7 @@ class PrettyPrinterOutputParser:
         Returns:
             Tuple of (bottom_dims, top_dims) as lists of integers
         """
-        bottom_dims = []
-        top_dims = []
-
-        lines = output.split('\n')
-
-        for line in lines:
-            if 'bottom_dimension_ids:' in line:
-                match = re.search(r'\[([\d,\s-]+)\]', line)
-                if match:
-                    bottom_dims = [int(x.strip()) for x in match.group(1).split(',')
-                                 if x.strip().lstrip('-').isdigit()]
-
-            if 'top_dimension_ids:' in line:
-                match = re.search(r'\[([\d,\s-]+)\]', line)
-                if match:
-                    top_dims = [int(x.strip()) for x in match.group(1).split(',')
-                               if x.strip().lstrip('-').isdigit()]
-
+        _, bottom_dims, top_dims = _parse_output(output)
         return bottom_dims, top_dims
 
     @staticmethod
@@ -146,7 +159,8 @@ class PrettyPrinterOutputParser:
         Returns:
             Number of transforms or None if not found
         """
-        match = re.search(r'ntransform:\s*(\d+)', output)
+        # One regex scan stops at the first hit near the top of the output
+        match = _NTRANSFORM_RE.search(output)
         if match:
             return int(match.group(1))
         return None
@@ -156,6 +170,9 @@ class PrettyPrinterOutputParser:
         """
         Parse complete pretty printer output into structured data.
 
+        The transforms and dimension IDs are collected in a single walk over
+        the output lines.
+
         Args:
             output: Pretty printer output string
 
@@ -166,9 +183,9 @@ class PrettyPrinterOutputParser:
                 - top_dims: List of top dimension IDs
                 - ntransform: Number of transforms
         """
-        bottom_dims, top_dims = PrettyPrinterOutputParser.parse_bottom_top_dims(output)
+        transforms, bottom_dims, top_dims = _parse_output(output)
         return {
-            'transforms': PrettyPrinterOutputParser.parse_transforms(output),
+            'transforms': transforms,
             'bottom_dims': bottom_dims,
             'top_dims': top_dims,
             'ntransform': PrettyPrinterOutputParser.parse_ntransform(output)
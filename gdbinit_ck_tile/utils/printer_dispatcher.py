@@ -6,8 +6,11 @@ based on type strings. It eliminates code duplication and makes adding new print
 types much easier.
 """
 
+import importlib
 from typing import Optional, Any
 
+from .type_cache import register_cache
+
 
 # Printer type mapping
 # Format: (type_pattern, printer_module, printer_class)
@@ -51,12 +54,89 @@ PRINTER_TYPE_MAP = [
 ]
 
 
+# (printer_module, printer_class) -> printer class, filled on first dispatch
+_RESOLVED_PRINTERS = {}
+
+
+def _resolve_printer(module_name: str, class_name: str) -> Optional[type]:
+    """
+    Import a printer class from the printers package, once.
+
+    The printer modules import this one, so they are imported lazily on
+    first use rather than at module load.
+
+    Args:
+        module_name: Module in the printers package (e.g., 'containers')
+        class_name: Printer class in that module
+
+    Returns:
+        The printer class, or None if it cannot be imported
+    """
+    key = (module_name, class_name)
+    try:
+        return _RESOLVED_PRINTERS[key]
+    except KeyError:
+        pass
+
+    try:
+        module = importlib.import_module(f'..printers.{module_name}', __package__)
+        printer_class = getattr(module, class_name)
+    except (ImportError, AttributeError):
+        # Not cached, so a later dispatch can try again
+        return None
+
+    _RESOLVED_PRINTERS[key] = printer_class
+    return printer_class
+
+
+# type string -> printer class, or None if no pattern matches
+_PRINTER_CLASSES = {}
+_MAX_PRINTER_CLASS_ENTRIES = 256
+register_cache(_PRINTER_CLASSES.clear)
+
+
+def _printer_class_for_type(type_str: str) -> Optional[type]:
+    """
+    Find the printer class for a type string, memoized per type string.
+
+    Results that depend on a failed import are not memoized, so a later
+    dispatch tries the import again, as _resolve_printer does.
+
+    Args:
+        type_str: The type string (from str(val.type))
+
+    Returns:
+        Printer class of the first matching pattern, or None
+    """
+    try:
+        return _PRINTER_CLASSES[type_str]
+    except KeyError:
+        pass
+
+    printer_class = None
+    import_failed = False
+    for pattern, module_name, class_name in PRINTER_TYPE_MAP:
+        if pattern in type_str:
+            printer_class = _resolve_printer(module_name, class_name)
+            if printer_class is not None:
+                break
+            # If we can't import the printer, continue to next pattern
+            import_failed = True
+
+    if not import_failed:
+        if len(_PRINTER_CLASSES) >= _MAX_PRINTER_CLASS_ENTRIES:
+            _PRINTER_CLASSES.clear()
+        _PRINTER_CLASSES[type_str] = printer_class
+    return printer_class
+
+
 def get_printer_for_type(val: Any, type_str: str) -> Optional[Any]:
     """
     Get the appropriate pretty printer for a given GDB value and type string.
 
     This function uses a data-driven approach to dispatch printers based on type
-    patterns. It checks patterns in order, returning the first match.
+    patterns. It checks patterns in order, returning the first match. The
+    matching class is cached per type string; only the instance is new.
 
     Args:
         val: The GDB value to print
@@ -72,52 +152,8 @@ def get_printer_for_type(val: Any, type_str: str) -> Optional[Any]:
         >>> if printer:
         ...     print(printer.to_string())
     """
-    for pattern, module_name, class_name in PRINTER_TYPE_MAP:
-        if pattern in type_str:
-            try:
-                # Import the printer module dynamically
-                if module_name == 'containers':
-                    from ..printers.containers import (
-                        TuplePrinter, ArrayPrinter, ThreadBufferPrinter
-                    )
-                    printer_class = locals()[class_name]
-                elif module_name == 'tile_distribution':
-                    from ..printers.tile_distribution import (
-                        TileWindowPrinter,
-                        StaticDistributedTensorPrinter,
-                        TileDistributionPrinter,
-                        TileDistributionEncodingPrinter
-                    )
-                    printer_class = locals()[class_name]
-                elif module_name == 'tensor_view':
-                    from ..printers.tensor_view import TensorViewPrinter
-                    printer_class = locals()[class_name]
-                elif module_name == 'tensor_adaptor':
-                    from ..printers.tensor_adaptor import TensorAdaptorPrinter
-                    printer_class = locals()[class_name]
-                elif module_name == 'tensor_descriptor':
-                    from ..printers.tensor_descriptor import TensorDescriptorPrinter
-                    printer_class = locals()[class_name]
-                elif module_name == 'tensor_coordinate':
-                    from ..printers.tensor_coordinate import (
-                        TensorCoordinatePrinter,
-                        TensorAdaptorCoordinatePrinter
-                    )
-                    printer_class = locals()[class_name]
-                elif module_name == 'tile_scatter_gather':
-                    from ..printers.tile_scatter_gather import TileScatterGatherPrinter
-                    printer_class = locals()[class_name]
-                else:
-                    continue
-
-                return printer_class(val)
-
-            except (ImportError, AttributeError, KeyError):
-                # If we can't import the printer, continue to next pattern
-                continue
-
-    # No match found
-    return None
+    printer_class = _printer_class_for_type(type_str)
+    return printer_class(val) if printer_class is not None else None
 
 
 def format_type_list():
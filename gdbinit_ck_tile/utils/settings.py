@@ -0,0 +1,101 @@
+"""
+Runtime settings for the CK-Tile pretty printers.
+
+The values live here so printers can read them without depending on GDB;
+the `set ck-tile-pp ...` parameters in commands/settings.py write them.
+"""
+
+import os
+
+from .type_cache import clear_stop_caches
+
+
+# Expose sub-objects of aggregate printers (tile_distribution, tile_window,
+# static_distributed_tensor, tile_scatter_gather) as GDB children instead of inlining them into
+# to_string. Off by default so the CLI output stays a single block.
+_structured_children = False
+
+# How much the aggregate printers show: 'full' (everything), 'brief'
+# (headers plus RsLengths/HsLengthss, no nested printers) or 'off' (headers
+# only). Lower levels keep frequent printing such as `bt` cheap.
+DETAIL_LEVELS = ('full', 'brief', 'off')
+_detail_level = 'full'
+
+# Include exception messages in printer output ("[error: msg]" rather than
+# "[error]"). GDB errors can quote whole template types, so formatting them
+# is skipped unless asked for, e.g. with CK_TILE_PP_VERBOSE=1.
+_verbose_errors = os.environ.get('CK_TILE_PP_VERBOSE', '') not in ('', '0')
+
+
+def structured_children_enabled():
+    """
+    Check whether aggregate printers should expose their members as children.
+
+    Returns:
+        True if structured children are enabled
+    """
+    return _structured_children
+
+
+def set_structured_children(enabled):
+    """
+    Enable or disable structured children for aggregate printers.
+
+    Args:
+        enabled: True to expose sub-objects as children
+    """
+    global _structured_children
+    _structured_children = bool(enabled)
+    # Cached printer output was formatted for the previous setting
+    clear_stop_caches()
+
+
+def detail_level():
+    """
+    Get how much the aggregate printers show.
+
+    Returns:
+        One of DETAIL_LEVELS
+    """
+    return _detail_level
+
+
+def set_detail_level(level):
+    """
+    Set how much the aggregate printers show.
+
+    Args:
+        level: One of DETAIL_LEVELS
+
+    Raises:
+        ValueError: If level is not a known detail level
+    """
+    global _detail_level
+    if level not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail level: {level}")
+    _detail_level = level
+    # Cached printer output was formatted for the previous setting
+    clear_stop_caches()
+
+
+def verbose_errors_enabled():
+    """
+    Check whether printers should show exception messages.
+
+    Returns:
+        True if verbose errors are enabled
+    """
+    return _verbose_errors
+
+
+def set_verbose_errors(enabled):
+    """
+    Enable or disable exception messages in printer output.
+
+    Args:
+        enabled: True to show the message of each error
+    """
+    global _verbose_errors
+    _verbose_errors = bool(enabled)
+    # Cached printer output was formatted for the previous setting
+    clear_stop_caches()
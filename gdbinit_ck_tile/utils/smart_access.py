@@ -10,6 +10,7 @@ Member Categories:
 3. RUNTIME_PREFERRED: Best with runtime, but can show structure from type (e.g., transforms)
 """
 
+import re
 from typing import Tuple, Optional, Any
 
 try:
@@ -206,92 +207,120 @@ class SmartMemberAccess:
     @staticmethod
     def _create_mock_descriptor(desc_type: str):
         """Create a mock descriptor object that can be used with TensorDescriptorPrinter."""
-        import re
-
-        class MockDescriptor:
-            def __init__(self, type_str):
-                self.type_str = type_str
-                self.type = self  # Mock type object
-
-                # Parse critical values from type to prevent [UNINITIALIZED]
-                self._parse_values()
-
-            def __str__(self):
-                return self.type_str
-
-            def fields(self):
-                """Mock fields method for compatibility."""
-                return []  # No base class fields for mock
-
-            def _parse_values(self):
-                """Parse important values from type string."""
-                # Count transforms
-                transform_count = self.type_str.count('embed') + self.type_str.count('pad') + \
-                                self.type_str.count('merge') + self.type_str.count('unmerge') + \
-                                self.type_str.count('pass_through')
-                self._ntransform = transform_count if transform_count > 0 else 1
-
-                # Count dimensions from sequences
-                hidden_dims = len(re.findall(r'sequence<[\d,\s-]+>', self.type_str))
-                self._ndim_hidden = max(1, hidden_dims - 2)  # Estimate
-                self._ndim_top = 2  # Common default
-
-                # Extract element space size if present
-                elem_match = re.search(r'ck_tile::constant<(\d+)[lL]?>', self.type_str)
-                if elem_match:
-                    self._element_space_size = int(elem_match.group(1))
-                else:
-                    self._element_space_size = 1  # Default to prevent uninitialized
-
-            def __getitem__(self, field_name):
-                # Provide minimal values to prevent [UNINITIALIZED]
-                class MockIntField:
-                    """Mock field that behaves like a GDB constant field."""
-                    def __init__(self, value):
-                        self._value = value
-                        # Mimic ck_tile::constant<N> type
-                        self.type = type('MockType', (), {
-                            '__str__': lambda s: f'ck_tile::constant<{value}>',
-                            'name': f'ck_tile::constant<{value}>'
-                        })()
-
-                    def __int__(self):
-                        return self._value
-
-                    def __getitem__(self, key):
-                        # For accessing 'value' member if needed
-                        if key == 'value':
-                            return self._value
-                        return None
-
-                if field_name == 'element_space_size_':
-                    return MockIntField(self._element_space_size)
-                elif field_name == 'ntransform_':
-                    return MockIntField(self._ntransform)
-                elif field_name == 'ndim_hidden_':
-                    return MockIntField(self._ndim_hidden)
-                elif field_name == 'ndim_top_':
-                    return MockIntField(self._ndim_top)
-                # Return None for other fields
-                return None
-
-        return MockDescriptor(desc_type)
+        return _MockDescriptor(desc_type)
 
     @staticmethod
     def _create_mock_adaptor(adaptor_type: str):
         """Create a mock adaptor object that can be used with TensorAdaptorPrinter."""
-        class MockAdaptor:
-            def __init__(self, type_str):
-                self.type_str = type_str
-                self.type = self
+        return _MockAdaptor(adaptor_type)
+
+
+# Sequences counted to estimate a mock descriptor's hidden dimensions
+_SEQUENCE_RE = re.compile(r'sequence<[\d,\s-]+>')
+# First constant in a descriptor type, taken as its element space size
+_CONSTANT_RE = re.compile(r'ck_tile::constant<(\d+)[lL]?>')
+
+
+class _MockConstantType:
+    """Type stand-in spelled like ck_tile::constant<N>."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, value):
+        self.name = f'ck_tile::constant<{value}>'
+
+    def __str__(self):
+        return self.name
+
+
+class _MockIntField:
+    """Mock field that behaves like a GDB constant field."""
+
+    __slots__ = ('_value', 'type')
+
+    def __init__(self, value):
+        self._value = value
+        # Mimic ck_tile::constant<N> type
+        self.type = _MockConstantType(value)
+
+    def __int__(self):
+        return self._value
+
+    def __getitem__(self, key):
+        # For accessing 'value' member if needed
+        if key == 'value':
+            return self._value
+        return None
 
-            def __str__(self):
-                return self.type_str
 
-            def __getitem__(self, field_name):
-                return None
+class _MockDescriptor:
+    """Descriptor stand-in (acting as its own type) with the fields TensorDescriptorPrinter reads."""
 
-        return MockAdaptor(adaptor_type)
+    __slots__ = ('type_str', 'type', '_ntransform', '_ndim_hidden', '_ndim_top',
+                 '_element_space_size')
+
+    def __init__(self, type_str):
+        self.type_str = type_str
+        self.type = self  # Mock type object
+
+        # Parse critical values from type to prevent [UNINITIALIZED]
+        self._parse_values()
+
+    def __str__(self):
+        return self.type_str
+
+    def fields(self):
+        """Mock fields method for compatibility."""
+        return []  # No base class fields for mock
+
+    def _parse_values(self):
+        """Parse important values from type string."""
+        from .cpp_type_parser import count_transforms
+
+        # Count transforms
+        transform_count = sum(count_transforms(self.type_str).values())
+        self._ntransform = transform_count if transform_count > 0 else 1
+
+        # Count dimensions from sequences
+        hidden_dims = len(_SEQUENCE_RE.findall(self.type_str))
+        self._ndim_hidden = max(1, hidden_dims - 2)  # Estimate
+        self._ndim_top = 2  # Common default
+
+        # Extract element space size if present
+        elem_match = _CONSTANT_RE.search(self.type_str)
+        if elem_match:
+            self._element_space_size = int(elem_match.group(1))
+        else:
+            self._element_space_size = 1  # Default to prevent uninitialized
+
+    def __getitem__(self, field_name):
+        # Provide minimal values to prevent [UNINITIALIZED]
+        if field_name == 'element_space_size_':
+            return _MockIntField(self._element_space_size)
+        elif field_name == 'ntransform_':
+            return _MockIntField(self._ntransform)
+        elif field_name == 'ndim_hidden_':
+            return _MockIntField(self._ndim_hidden)
+        elif field_name == 'ndim_top_':
+            return _MockIntField(self._ndim_top)
+        # Return None for other fields
+        return None
+
+
+class _MockAdaptor:
+    """Adaptor stand-in (acting as its own type) whose members all read as None."""
+
+    __slots__ = ('type_str', 'type')
+
+    def __init__(self, type_str):
+        self.type_str = type_str
+        self.type = self
+
+    def __str__(self):
+        return self.type_str
+
+    def __getitem__(self, field_name):
+        return None
 
 
 def format_access_indicator(access_method: str) -> str:
@@ -5,7 +5,11 @@ Handles both compile-time constants and runtime values.
 
 import gdb
 import re
-from .cpp_type_parser import extract_constant_value
+from .cpp_type_parser import extract_constant_value, find_param_end
+
+
+# Index and start of the element type in tuple_object<Index, ElementType, bool>
+_TUPLE_OBJECT_RE = re.compile(r'tuple_object<(\d+),\s*')
 
 
 def extract_tuple_elements(tuple_obj):
@@ -56,26 +60,13 @@ def extract_tuple_elements(tuple_obj):
                         try:
                             # Extract element type from tuple_object<Index, ElementType, bool>
                             # Need bracket counting because ElementType may have nested templates
-                            match = re.search(r'tuple_object<(\d+),\s*', base_field_name_str)
+                            match = _TUPLE_OBJECT_RE.search(base_field_name_str)
 
                             if match:
                                 start_pos = match.end()
 
-                                # Count brackets to find where ElementType ends
-                                bracket_count = 0
-                                pos = start_pos
-
-                                while pos < len(base_field_name_str):
-                                    if base_field_name_str[pos] == '<':
-                                        bracket_count += 1
-                                    elif base_field_name_str[pos] == '>':
-                                        if bracket_count > 0:
-                                            bracket_count -= 1
-                                        else:
-                                            break
-                                    elif base_field_name_str[pos] == ',' and bracket_count == 0:
-                                        break
-                                    pos += 1
+                                # Skip nested templates to find where ElementType ends
+                                pos = find_param_end(base_field_name_str, start_pos)
 
                                 element_type = base_field_name_str[start_pos:pos].strip()
 
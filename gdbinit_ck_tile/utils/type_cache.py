@@ -0,0 +1,431 @@
+"""
+Session-wide caches for information derived from GDB types.
+
+Anything computed purely from a type (field layout, parsed template
+parameters, ...) stays valid for as long as the same debug info is loaded.
+Caches in this module register themselves so that loading a new objfile,
+which may redefine types, drops every stale entry at once. Caches of values
+read from the inferior are also dropped whenever its memory may change.
+"""
+
+try:
+    import gdb
+except ImportError:
+    # For testing outside GDB
+    gdb = None
+
+
+# Callables that empty one cache each, run by clear_all_caches()
+_CACHE_CLEARERS = []
+
+
+def register_cache(clear_func):
+    """
+    Register a cache so it is emptied whenever debug info changes.
+
+    Args:
+        clear_func: Zero-argument callable that empties the cache
+
+    Returns:
+        clear_func, so this can be used on a cache's clear method directly
+    """
+    _CACHE_CLEARERS.append(clear_func)
+    return clear_func
+
+
+def clear_all_caches(event=None):
+    """
+    Empty every registered cache.
+
+    Args:
+        event: GDB event object (unused, present for event handler signature)
+    """
+    for clear_func in _CACHE_CLEARERS:
+        clear_func()
+
+
+# Callables that empty caches only valid until the inferior resumes
+_STOP_CACHE_CLEARERS = []
+
+
+def register_stop_cache(clear_func):
+    """
+    Register a cache that is emptied whenever the inferior resumes.
+
+    Such caches are also emptied with the other caches on a new objfile.
+
+    Args:
+        clear_func: Zero-argument callable that empties the cache
+
+    Returns:
+        clear_func
+    """
+    _STOP_CACHE_CLEARERS.append(clear_func)
+    return register_cache(clear_func)
+
+
+def clear_stop_caches(event=None):
+    """
+    Empty every cache registered with register_stop_cache().
+
+    Args:
+        event: GDB event object (unused, present for event handler signature)
+    """
+    for clear_func in _STOP_CACHE_CLEARERS:
+        clear_func()
+
+
+if gdb is not None and hasattr(gdb, 'events'):
+    gdb.events.new_objfile.connect(clear_all_caches)
+    gdb.events.cont.connect(clear_stop_caches)
+    # Memory can also change while stopped (`set var`, calling functions)
+    for _event_name in ('memory_changed', 'inferior_call'):
+        _event = getattr(gdb.events, _event_name, None)
+        if _event is not None:
+            _event.connect(clear_stop_caches)
+
+
+def type_key(gdb_type):
+    """
+    Get a hashable key identifying a type without re-printing it.
+
+    The type's name is used when available since reading it is much cheaper
+    than str(type) for large templates. Note that the name ignores cv
+    qualifiers, so only use this for facts that do not depend on them.
+
+    Args:
+        gdb_type: GDB type (or mock type from type-only printing)
+
+    Returns:
+        String key for the type
+    """
+    name = getattr(gdb_type, 'name', None)
+    if isinstance(name, str) and name:
+        return name
+    return str(gdb_type)
+
+
+def stripped_type_key(gdb_type):
+    """
+    Get the type_key of a type with typedefs stripped.
+
+    A local alias (using Desc = ...) has the same unqualified name in every
+    instantiation of the enclosing template, so caches of per-type facts
+    key on the type it stands for.
+
+    Args:
+        gdb_type: GDB type (or mock type from type-only printing)
+
+    Returns:
+        String key for the stripped type
+    """
+    try:
+        gdb_type = gdb_type.strip_typedefs()
+    except Exception:
+        pass
+    return type_key(gdb_type)
+
+
+# Upper bound on entries in the caches below
+MAX_OBJECT_CACHE_ENTRIES = 4096
+
+# (stripped type key, marker) -> type of the first field whose type contains
+# the marker (or None)
+_FIELD_TYPE_CACHE = {}
+register_cache(_FIELD_TYPE_CACHE.clear)
+
+
+def find_field_type(gdb_type, marker):
+    """
+    Find the type of the first field whose type string contains marker.
+
+    Stringifying every field type of a CK-Tile class is expensive, and the
+    answer only depends on the type, so it is computed once per type.
+
+    Args:
+        gdb_type: GDB type whose fields to search
+        marker: Substring to look for (e.g., 'tensor_adaptor')
+
+    Returns:
+        GDB type of the matching field, or None if no field matches
+    """
+    key = (stripped_type_key(gdb_type), marker)
+    try:
+        return _FIELD_TYPE_CACHE[key]
+    except KeyError:
+        pass
+
+    field_type = None
+    for field in gdb_type.fields():
+        if marker in str(field.type):
+            field_type = field.type
+            break
+
+    if len(_FIELD_TYPE_CACHE) >= MAX_OBJECT_CACHE_ENTRIES:
+        _FIELD_TYPE_CACHE.clear()
+    _FIELD_TYPE_CACHE[key] = field_type
+    return field_type
+
+
+# (type name, stripped type key) -> str(type)
+_TYPE_STR_CACHE = {}
+register_cache(_TYPE_STR_CACHE.clear)
+
+# name of the typedef-stripped type -> str(type.strip_typedefs())
+_STRIPPED_TYPE_STR_CACHE = {}
+register_cache(_STRIPPED_TYPE_STR_CACHE.clear)
+
+
+def _stable_type_key(gdb_type):
+    """
+    Get a key that is the same for every gdb.Type wrapping one type.
+
+    GDB creates a new gdb.Type on each value.type read, so the object
+    itself cannot be the key. The name can, as long as the type has no cv
+    qualifiers, which the name leaves out.
+
+    Args:
+        gdb_type: GDB type
+
+    Returns:
+        Type name, or None if the type is unnamed or cv-qualified
+    """
+    try:
+        name = gdb_type.name
+        if name and gdb_type == gdb_type.unqualified():
+            return name
+    except Exception:
+        pass
+    return None
+
+
+def _named_type_str(cache, key, gdb_type, to_str):
+    """
+    Look up or compute a type's string in a cache.
+
+    Types without a stable key are stringified directly.
+
+    Args:
+        cache: Dict of key -> string
+        key: Key built from _stable_type_key, or None
+        gdb_type: GDB type
+        to_str: Callable computing the string for gdb_type
+
+    Returns:
+        Type string
+    """
+    if key is None:
+        return to_str(gdb_type)
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    text = to_str(gdb_type)
+
+    if len(cache) >= MAX_OBJECT_CACHE_ENTRIES:
+        cache.clear()
+    cache[key] = text
+    return text
+
+
+def type_string(gdb_type):
+    """
+    Get str(gdb_type), memoized per type name.
+
+    Unlike type_key this keeps cv qualifiers, so it can replace any
+    str(value.type) call. The stripped type is part of the key, since a
+    local alias has the same name in every instantiation of the enclosing
+    template. Strings (from type-only mocks) are returned unchanged.
+
+    Args:
+        gdb_type: GDB type (or type string from type-only printing)
+
+    Returns:
+        Type string
+    """
+    if isinstance(gdb_type, str):
+        return gdb_type
+    key = _stable_type_key(gdb_type)
+    if key is not None:
+        key = (key, stripped_type_key(gdb_type))
+    return _named_type_str(_TYPE_STR_CACHE, key, gdb_type, str)
+
+
+def stripped_type_str(gdb_type):
+    """
+    Get str(gdb_type.strip_typedefs()), memoized per stripped type name.
+
+    The key is the name of the stripped type, not of gdb_type: a local
+    alias (using Dist = ...) keeps the same unqualified name in every
+    instantiation of the enclosing template. Strings (from type-only mocks)
+    are returned unchanged.
+
+    Args:
+        gdb_type: GDB type (or type string from type-only printing)
+
+    Returns:
+        Type string with typedefs stripped (or the plain type string if
+        stripping fails)
+    """
+    if isinstance(gdb_type, str):
+        return gdb_type
+    try:
+        stripped = gdb_type.strip_typedefs()
+    except Exception:
+        return str(gdb_type)
+    return _named_type_str(_STRIPPED_TYPE_STR_CACHE, _stable_type_key(stripped),
+                           stripped, str)
+
+
+# stripped type key -> frozenset of member names (including base class
+# members), or None
+_FIELD_NAMES_CACHE = {}
+register_cache(_FIELD_NAMES_CACHE.clear)
+
+
+def field_names(gdb_type):
+    """
+    Get the names of all data members of a type, including inherited ones.
+
+    Lets printers test for optional members without raising (and catching)
+    an exception on every value that lacks them. Member names do not depend
+    on cv qualifiers, but do on the type behind a typedef, so the key is
+    the type_key of the stripped type.
+
+    Args:
+        gdb_type: GDB type (or type string from type-only printing)
+
+    Returns:
+        frozenset of member names, or None if the type's fields are not
+        available or empty (callers should then fall back to trying the access)
+    """
+    if isinstance(gdb_type, str):
+        return None
+
+    try:
+        stripped = gdb_type.strip_typedefs()
+    except Exception:
+        return None
+
+    key = type_key(stripped)
+    try:
+        return _FIELD_NAMES_CACHE[key]
+    except KeyError:
+        pass
+
+    names = set()
+    try:
+        pending = [stripped]
+        while pending:
+            for field in pending.pop().fields():
+                if field.is_base_class:
+                    pending.append(field.type.strip_typedefs())
+                elif field.name:
+                    names.add(field.name)
+        # No members at all usually means an incomplete type: treat as unknown
+        result = frozenset(names) if names else None
+    except Exception:
+        result = None
+
+    if len(_FIELD_NAMES_CACHE) >= MAX_OBJECT_CACHE_ENTRIES:
+        _FIELD_NAMES_CACHE.clear()
+    _FIELD_NAMES_CACHE[key] = result
+    return result
+
+
+# (address, stripped type key, ptid, lane, extra...) -> formatted output of a value in memory
+_VALUE_OUTPUT_CACHE = {}
+register_stop_cache(_VALUE_OUTPUT_CACHE.clear)
+
+
+def _selected_context():
+    """
+    Identify the selected thread and lane.
+
+    On GPUs private (scratch) memory is per lane, so the same address holds
+    different data depending on which thread and lane are selected.
+
+    Returns:
+        (ptid, lane) tuple; either part is None when not available
+    """
+    try:
+        thread = gdb.selected_thread()
+        ptid = thread.ptid if thread is not None else None
+    except Exception:
+        ptid = None
+
+    # rocgdb exposes the selected lane as $_lane
+    lane = None
+    convenience_variable = getattr(gdb, 'convenience_variable', None)
+    if convenience_variable is not None:
+        try:
+            lane_value = convenience_variable('_lane')
+            if lane_value is not None:
+                lane = int(lane_value)
+        except Exception:
+            lane = None
+
+    return ptid, lane
+
+
+def value_output_key(val, *extra):
+    """
+    Get a key identifying a value by where it lives in inferior memory.
+
+    Only real values with an address qualify; mocks from type-only printing
+    and values without an address (registers, computed results) have no
+    stable identity and get None. The selected thread and lane are part of
+    the key, since per-lane memory makes addresses ambiguous across them.
+    The type is keyed with typedefs stripped, as local aliases of different
+    instantiations share a name.
+
+    Args:
+        val: GDB value (or mock)
+        *extra: Additional key parts (e.g., the indentation)
+
+    Returns:
+        Hashable key, or None if the value cannot be cached
+    """
+    value_class = getattr(gdb, 'Value', None)
+    if value_class is None or not isinstance(val, value_class):
+        return None
+    try:
+        address = val.address
+        if address is None:
+            return None
+        return (int(address), stripped_type_key(val.type)) + _selected_context() + extra
+    except Exception:
+        return None
+
+
+def cached_value_output(val, indent, build):
+    """
+    Get a printer's output for a value, reusing it while the inferior is stopped.
+
+    Re-printing the same object (`display`, front-ends refreshing their
+    variable views) then costs a dictionary lookup instead of formatting
+    every nested sub-printer again.
+
+    Args:
+        val: GDB value being printed
+        indent: Indentation the output is rendered at (part of the key)
+        build: Zero-argument callable producing the output
+
+    Returns:
+        Formatted output string
+    """
+    key = value_output_key(val, indent)
+    if key is None:
+        return build()
+
+    try:
+        return _VALUE_OUTPUT_CACHE[key]
+    except KeyError:
+        pass
+
+    text = build()
+    if len(_VALUE_OUTPUT_CACHE) >= MAX_OBJECT_CACHE_ENTRIES:
+        _VALUE_OUTPUT_CACHE.clear()
+    _VALUE_OUTPUT_CACHE[key] = text
+    return text
@@ -21,7 +21,16 @@ echo
 echo "----------------------------------------"
 echo
 
-# Test 3: GDB mock tests
+# Test 3: Cache and children tests
+echo "Running cache and children tests..."
+python3 test_type_cache.py
+python3 test_scatter_gather_children.py
+
+echo
+echo "----------------------------------------"
+echo
+
+# Test 4: GDB mock tests
 echo "Running GDB mock tests..."
 echo "Testing 15-transform descriptor..."
 rocgdb -batch -x test_15_transforms.gdb 2>&1 | tail -5
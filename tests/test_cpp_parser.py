@@ -18,6 +18,33 @@ def test_find_matching_bracket():
     text = "nested<outer<inner<>>>"
     assert find_matching_bracket(text, 6, '<', '>') == 21
 
+    # Unmatched bracket
+    assert find_matching_bracket("open<int", 4) == -1
+
+    # Other bracket pairs
+    assert find_matching_bracket("f(a, (b), c) + (d)", 1, '(', ')') == 11
+    assert find_matching_bracket("f(a, (b)", 1, '(', ')') == -1
+
+
+def test_find_param_end():
+    """Test skipping one template parameter."""
+    text = "array<tuple<int, float>, 4>"
+    assert find_param_end(text, 6) == 23
+    assert find_param_end(text, 25) == 26
+    assert find_param_end("int", 0) == 3
+    assert find_param_end("x<int, y", 0) == len("x<int, y")
+
+
+def test_build_bracket_map():
+    """Test bracket-pair map and template end lookup."""
+    text = "a<b<c>, d>> x<"
+    assert build_bracket_map(text) == {1: 9, 3: 5}
+
+    # Position just past the matching '>', or len(text) if unmatched
+    assert find_template_end(text, 2) == 10
+    assert find_template_end(text, 4) == 6
+    assert find_template_end(text, len(text)) == len(text)
+
 
 def test_extract_template_content():
     """Test template content extraction."""
@@ -63,12 +90,15 @@ def test_parse_sequence_values():
     assert parse_sequence_values("1, 2, 3") == [1, 2, 3]
     assert parse_sequence_values("") == []
     assert parse_sequence_values("-1, 0, 1") == [-1, 0, 1]
+    assert parse_sequence_values("4l, 8") == [4, 8]
 
 
 if __name__ == "__main__":
     # Run all tests
     tests = [
         test_find_matching_bracket,
+        test_build_bracket_map,
+        test_find_param_end,
         test_extract_template_content,
         test_split_template_params,
         test_extract_sequences,
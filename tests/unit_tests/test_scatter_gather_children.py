@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test tile_scatter_gather children with structured children enabled.
+Runs without GDB by installing a minimal stand-in gdb module.
+"""
+
+import sys
+import os
+import types
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeValue:
+    """Stand-in for gdb.Value; scatter/gather values are printed from their type."""
+
+    def __init__(self, type):
+        self.type = type
+        self.address = None
+
+    def __getitem__(self, key):
+        raise fake_gdb.error(f"No member named {key}")
+
+
+fake_gdb = types.ModuleType('gdb')
+fake_gdb.Value = FakeValue
+fake_gdb.error = RuntimeError
+sys.modules['gdb'] = fake_gdb
+
+from gdbinit_ck_tile.utils import settings
+from gdbinit_ck_tile.printers.tile_scatter_gather import TileScatterGatherPrinter
+
+TRANSFORMS = 'ck_tile::tuple<ck_tile::pass_through<ck_tile::constant<8>>>'
+LOWER = 'ck_tile::tuple<ck_tile::sequence<0>>'
+UPPER = 'ck_tile::tuple<ck_tile::sequence<1>>'
+DESC = (f'ck_tile::tensor_descriptor<{TRANSFORMS}, {LOWER}, {UPPER}, '
+        'ck_tile::sequence<1>, ck_tile::constant<8l>>')
+ADAPTOR = (f'ck_tile::tensor_adaptor<{TRANSFORMS}, {LOWER}, {UPPER}, '
+           'ck_tile::sequence<0>, ck_tile::sequence<1>>')
+BUF = 'ck_tile::buffer_view<(ck_tile::address_space_enum)1, float, int, true, (ck_tile::amd_buffer_coherence_enum)0>'
+VIEW = f'ck_tile::tensor_view<{BUF}, {DESC}, (ck_tile::memory_operation_enum)0>'
+ENCODING = ('ck_tile::tile_distribution_encoding<ck_tile::sequence<1>, '
+            'ck_tile::tuple<ck_tile::sequence<8>>, ck_tile::tuple<ck_tile::sequence<1>>, '
+            'ck_tile::tuple<ck_tile::sequence<0>>, ck_tile::sequence<1>, ck_tile::sequence<0>>')
+DIST = f'ck_tile::tile_distribution<{ADAPTOR}, {DESC}, {ENCODING}, ck_tile::sequence<0>>'
+SCATTER_GATHER = (f'ck_tile::tile_scatter_gather<{VIEW}, ck_tile::tuple<ck_tile::constant<64>, '
+                  f'ck_tile::constant<32>>, {DIST}, ck_tile::array<int, 4>, 0, 1, '
+                  '(ck_tile::memory_operation_enum)1>')
+
+
+def test_structured_children():
+    """Children are counted without rendering and rendered as they are read."""
+    print("Testing scatter/gather children...")
+    settings.set_structured_children(True)
+    try:
+        printer = TileScatterGatherPrinter(FakeValue(SCATTER_GATHER))
+
+        renders = []
+        render_distribution = printer._render_distribution
+
+        def counting_render(type_str, indent):
+            renders.append(type_str)
+            return render_distribution(type_str, indent)
+
+        printer._render_distribution = counting_render
+
+        assert printer.num_children() == 2
+        assert renders == []
+        # The type string is read once and reused by the other calls
+        assert printer._type_str == SCATTER_GATHER
+
+        children = printer.children()
+        name, text = next(children)
+        assert name == 'tile_distribution'
+        assert isinstance(text, str) and 'tile_distribution' in text
+        assert len(renders) == 1
+
+        name, text = next(children)
+        assert name == 'bottom_tensor_view_'
+        assert isinstance(text, str) and 'tensor_view' in text
+
+        assert [n for n, _ in printer.children_range(1, 2)] == ['bottom_tensor_view_']
+
+        # The nested renders are left to the children
+        output = printer.to_string()
+        assert output.startswith('tile_scatter_gather{')
+        assert 'bottom_tensor_view_' not in output
+        assert printer.display_hint() is None
+    finally:
+        settings.set_structured_children(False)
+
+    print("✓ scatter/gather children test passed")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing tile_scatter_gather children")
+    print("=" * 60)
+
+    try:
+        test_structured_children()
+
+        print("\n" + "=" * 60)
+        print("All tests passed successfully!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
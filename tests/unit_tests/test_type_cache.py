@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Tests for the session caches in type_cache.
+Runs without GDB by installing a minimal stand-in gdb module.
+"""
+
+import sys
+import os
+import types
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeThread:
+    def __init__(self, ptid):
+        self.ptid = ptid
+
+
+class FakeType:
+    """Stand-in for gdb.Type; GDB hands out a new one on every value.type read."""
+
+    str_calls = 0
+
+    def __init__(self, name, qualifier='', target=None, fields=()):
+        self.name = name
+        self.qualifier = qualifier
+        self.target = target
+        self._fields = list(fields)
+
+    def __eq__(self, other):
+        return (self.name, self.qualifier) == (other.name, other.qualifier)
+
+    def __hash__(self):
+        return hash((self.name, self.qualifier))
+
+    def __str__(self):
+        FakeType.str_calls += 1
+        return self.qualifier + self.name
+
+    def unqualified(self):
+        return FakeType(self.name, target=self.target)
+
+    def fields(self):
+        return self._fields
+
+    def strip_typedefs(self):
+        return FakeType(self.target, fields=self._fields) if self.target else self
+
+
+class FakeField:
+    """Stand-in for gdb.Field."""
+
+    def __init__(self, name, type, is_base_class=False):
+        self.name = name
+        self.type = type
+        self.is_base_class = is_base_class
+
+
+class FakeValue:
+    """Stand-in for gdb.Value with an address and a type."""
+
+    def __init__(self, type, address):
+        self.type = type
+        self.address = address
+
+
+fake_gdb = types.ModuleType('gdb')
+fake_gdb.Value = FakeValue
+fake_gdb.error = RuntimeError
+fake_gdb.selected = FakeThread((1, 1, 0))
+fake_gdb.selected_thread = lambda: fake_gdb.selected
+sys.modules['gdb'] = fake_gdb
+
+from gdbinit_ck_tile.utils import type_cache
+
+
+def test_value_output_per_thread():
+    """Cached output is not reused after selecting another thread."""
+    print("Testing per-thread value output cache...")
+    type_cache.clear_all_caches()
+
+    val = FakeValue('ck_tile::static_distributed_tensor<float>', 0x1000)
+    memory = {(1, 1, 0): 'thread 1 data', (1, 2, 0): 'thread 2 data'}
+    builds = []
+
+    def build():
+        builds.append(fake_gdb.selected.ptid)
+        return memory[fake_gdb.selected.ptid]
+
+    fake_gdb.selected = FakeThread((1, 1, 0))
+    assert type_cache.cached_value_output(val, '', build) == 'thread 1 data'
+    assert type_cache.cached_value_output(val, '', build) == 'thread 1 data'
+    assert len(builds) == 1
+
+    fake_gdb.selected = FakeThread((1, 2, 0))
+    assert type_cache.cached_value_output(val, '', build) == 'thread 2 data'
+    assert len(builds) == 2
+
+    fake_gdb.selected = FakeThread((1, 1, 0))
+    assert type_cache.cached_value_output(val, '', build) == 'thread 1 data'
+    assert len(builds) == 2
+
+    print("✓ per-thread value output cache test passed")
+
+
+def test_type_string_across_wrappers():
+    """Distinct wrappers of one type share a type_string entry."""
+    print("Testing type_string across type wrappers...")
+    type_cache.clear_all_caches()
+
+    name = 'ck_tile::tile_window_with_static_distribution<float>'
+    first = FakeType(name)
+    second = FakeType(name)
+    assert first is not second
+
+    FakeType.str_calls = 0
+    assert type_cache.type_string(first) == name
+    assert type_cache.type_string(second) == name
+    assert FakeType.str_calls == 1
+
+    # cv-qualified types keep their own spelling
+    assert type_cache.type_string(FakeType(name, 'const ')) == 'const ' + name
+
+    # A local alias gets one entry per type it stands for
+    FakeType.str_calls = 0
+    type_cache.type_string(FakeType('Dist', target='ck_tile::tile_distribution<4>'))
+    type_cache.type_string(FakeType('Dist', target='ck_tile::tile_distribution<8>'))
+    type_cache.type_string(FakeType('Dist', target='ck_tile::tile_distribution<4>'))
+    assert FakeType.str_calls == 2
+
+    print("✓ type_string wrapper test passed")
+
+
+def test_stripped_type_str_across_wrappers():
+    """stripped_type_str is shared per target, not per alias name."""
+    print("Testing stripped_type_str across type wrappers...")
+    type_cache.clear_all_caches()
+
+    target = 'ck_tile::static_distributed_tensor<float>'
+    first = FakeType('CTile', target=target)
+    second = FakeType('CTile', target=target)
+
+    FakeType.str_calls = 0
+    assert type_cache.stripped_type_str(first) == target
+    assert type_cache.stripped_type_str(second) == target
+    assert FakeType.str_calls == 1
+
+    # A local alias has the same name in every instantiation
+    other = 'ck_tile::static_distributed_tensor<_Float16>'
+    assert type_cache.stripped_type_str(FakeType('CTile', target=other)) == other
+    assert type_cache.stripped_type_str(first) == target
+
+    print("✓ stripped_type_str wrapper test passed")
+
+
+def test_find_field_type_per_target():
+    """Descriptors behind one alias name do not share a base field type."""
+    print("Testing find_field_type behind a local alias...")
+    type_cache.clear_all_caches()
+
+    base_4 = FakeType('ck_tile::tensor_adaptor<4>')
+    base_8 = FakeType('ck_tile::tensor_adaptor<8>')
+    desc_4 = FakeType('Desc', target='ck_tile::tensor_descriptor<4>',
+                      fields=[FakeField(None, base_4)])
+    desc_8 = FakeType('Desc', target='ck_tile::tensor_descriptor<8>',
+                      fields=[FakeField(None, base_8)])
+
+    assert type_cache.find_field_type(desc_4, 'tensor_adaptor') is base_4
+    assert type_cache.find_field_type(desc_8, 'tensor_adaptor') is base_8
+
+    print("✓ find_field_type alias test passed")
+
+
+def test_field_names_per_target():
+    """Windows behind one alias name do not share a member set."""
+    print("Testing field_names behind a local alias...")
+    type_cache.clear_all_caches()
+
+    member = FakeType('int')
+    plain = FakeType('Window', target='ck_tile::tile_window<0>',
+                     fields=[FakeField('bottom_tensor_view_', member)])
+    precomputed = FakeType('Window', target='ck_tile::tile_window<1>',
+                           fields=[FakeField('bottom_tensor_view_', member),
+                                   FakeField('pre_computed_coords_', member)])
+
+    assert type_cache.field_names(plain) == {'bottom_tensor_view_'}
+    assert 'pre_computed_coords_' in type_cache.field_names(precomputed)
+
+    print("✓ field_names alias test passed")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("Testing type_cache")
+    print("=" * 60)
+
+    try:
+        test_value_output_per_thread()
+        test_type_string_across_wrappers()
+        test_stripped_type_str_across_wrappers()
+        test_find_field_type_per_target()
+        test_field_names_per_target()
+
+        print("\n" + "=" * 60)
+        print("All tests passed successfully!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ Unexpected error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()